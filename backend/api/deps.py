@@ -15,6 +15,13 @@ oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/users/token", auto_
 
 logger = logging.getLogger(__name__)
 
+# Dependencies that only hand out a cached handle (or inspect an already
+# resolved user) are ``async def`` so FastAPI calls them inline instead of
+# dispatching each one to the threadpool. Anything that performs blocking
+# I/O (DB lookups, bcrypt) stays a plain ``def``. Building a handle runs
+# CREATE TABLE/INDEX, so the app warms every cache at startup through
+# warm_db_dependencies() and the first request never does it inline.
+
 
 @lru_cache(maxsize=1)
 def _file_db() -> FileDB:
@@ -46,32 +53,32 @@ def _user_db() -> UserDB:
     return UserDB()
 
 
-def get_file_db() -> FileDB:
+async def get_file_db() -> FileDB:
     """Dependency that provides a shared FileDB instance."""
     return _file_db()
 
 
-def get_conversion_db() -> ConversionDB:
+async def get_conversion_db() -> ConversionDB:
     """Dependency that provides a shared ConversionDB instance."""
     return _conversion_db()
 
 
-def get_conversion_relations_db() -> ConversionRelationsDB:
+async def get_conversion_relations_db() -> ConversionRelationsDB:
     """Dependency that provides a shared ConversionRelationsDB instance."""
     return _conversion_relations_db()
 
 
-def get_conversion_job_db() -> ConversionJobDB:
+async def get_conversion_job_db() -> ConversionJobDB:
     """Dependency that provides a shared ConversionJobDB instance."""
     return _conversion_job_db()
 
 
-def get_settings_db() -> SettingsDB:
+async def get_settings_db() -> SettingsDB:
     """Dependency that provides a shared SettingsDB instance."""
     return _settings_db()
 
 
-def get_user_db() -> UserDB:
+async def get_user_db() -> UserDB:
     """Dependency that provides a shared UserDB instance."""
     return _user_db()
 
@@ -81,7 +88,7 @@ def _api_key_db() -> ApiKeyDB:
     return ApiKeyDB()
 
 
-def get_api_key_db() -> ApiKeyDB:
+async def get_api_key_db() -> ApiKeyDB:
     """Dependency that provides a shared ApiKeyDB instance."""
     return _api_key_db()
 
@@ -91,7 +98,7 @@ def _user_identity_db() -> UserIdentityDB:
     return UserIdentityDB()
 
 
-def get_user_identity_db() -> UserIdentityDB:
+async def get_user_identity_db() -> UserIdentityDB:
     """Dependency that provides a shared UserIdentityDB instance."""
     return _user_identity_db()
 
@@ -170,7 +177,7 @@ def get_current_user_optional(
     return _resolve_user_from_api_key(token, api_key_db, user_db)
 
 
-def get_current_active_user(current_user: dict = Depends(get_current_user)) -> dict:
+async def get_current_active_user(current_user: dict = Depends(get_current_user)) -> dict:
     """Ensure the current user exists and is not disabled."""
     if current_user["disabled"]:
         raise HTTPException(
@@ -180,7 +187,7 @@ def get_current_active_user(current_user: dict = Depends(get_current_user)) -> d
     return current_user
 
 
-def get_current_admin_user(current_user: dict = Depends(get_current_active_user)) -> dict:
+async def get_current_admin_user(current_user: dict = Depends(get_current_active_user)) -> dict:
     """Ensure the current user has the admin role."""
     if current_user["role"] != "admin":
         raise HTTPException(
@@ -195,7 +202,7 @@ def _default_formats_db() -> DefaultFormatsDB:
     return DefaultFormatsDB()
 
 
-def get_default_formats_db() -> DefaultFormatsDB:
+async def get_default_formats_db() -> DefaultFormatsDB:
     """Dependency that provides a shared DefaultFormatsDB instance."""
     return _default_formats_db()
 
@@ -203,7 +210,7 @@ def get_default_formats_db() -> DefaultFormatsDB:
 def _default_qualities_db() -> DefaultQualitiesDB:
     return DefaultQualitiesDB()
 
-def get_default_qualities_db() -> DefaultQualitiesDB:
+async def get_default_qualities_db() -> DefaultQualitiesDB:
     """Dependency that provides a shared DefaultQualitiesDB instance."""
     return _default_qualities_db()
 
@@ -228,21 +235,42 @@ def _default_compression_levels_db() -> DefaultCompressionLevelsDB:
     return DefaultCompressionLevelsDB()
 
 
-def get_compression_db() -> CompressionDB:
+async def get_compression_db() -> CompressionDB:
     """Dependency that provides a shared CompressionDB instance."""
     return _compression_db()
 
 
-def get_compression_relations_db() -> CompressionRelationsDB:
+async def get_compression_relations_db() -> CompressionRelationsDB:
     """Dependency that provides a shared CompressionRelationsDB instance."""
     return _compression_relations_db()
 
 
-def get_compression_job_db() -> CompressionJobDB:
+async def get_compression_job_db() -> CompressionJobDB:
     """Dependency that provides a shared CompressionJobDB instance."""
     return _compression_job_db()
 
 
-def get_default_compression_levels_db() -> DefaultCompressionLevelsDB:
+async def get_default_compression_levels_db() -> DefaultCompressionLevelsDB:
     """Dependency that provides a shared DefaultCompressionLevelsDB instance."""
     return _default_compression_levels_db()
+
+
+def warm_db_dependencies() -> None:
+    """Build every cached DB handle ahead of the first request."""
+    for build_db in (
+        _file_db,
+        _conversion_db,
+        _conversion_relations_db,
+        _conversion_job_db,
+        _settings_db,
+        _user_db,
+        _api_key_db,
+        _user_identity_db,
+        _default_formats_db,
+        _default_qualities_db,
+        _compression_db,
+        _compression_relations_db,
+        _compression_job_db,
+        _default_compression_levels_db,
+    ):
+        build_db()
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from registry import compressor_registry
-from core import get_settings, delete_file_and_metadata
+from core import get_settings, delete_file_and_metadata, delete_all_files_and_metadata
 from db import CompressionDB, FileDB, CompressionRelationsDB, SettingsDB, DefaultCompressionLevelsDB
 from services import CompressionFailedError, run_compression_job
 from api.deps import (
@@ -140,10 +140,8 @@ def delete_all_compressions(
     current_user: dict = Depends(get_current_active_user),
 ):
     """Delete all compressed files and their relations for the current user"""
-    compressed_files = compression_db.list_files(user_id=current_user["uuid"])
-    for file in compressed_files:
-        delete_file_and_metadata(file['id'], compression_db)
-        compression_relations_db.delete_relation_by_compressed(file['id'])
+    delete_all_files_and_metadata(current_user["uuid"], compression_db)
+    compression_relations_db.delete_relations_by_user(current_user["uuid"])
     return {"message": "All compression history deleted successfully"}
 
 
@@ -3,7 +3,7 @@ import shutil
 import uuid
 from fastapi import APIRouter, Depends, HTTPException
 from registry import registry
-from core import get_settings, sanitize_extension, delete_file_and_metadata
+from core import get_settings, sanitize_extension, delete_file_and_metadata, delete_all_files_and_metadata
 from db import ConversionDB, FileDB, ConversionRelationsDB, SettingsDB, DefaultQualitiesDB
 from services import ConversionFailedError, run_conversion_job
 from api.deps import get_current_active_user, get_file_db, get_conversion_db, get_conversion_relations_db, get_settings_db, get_default_qualities_db
@@ -48,28 +48,10 @@ def list_conversions(
     current_user: dict = Depends(get_current_active_user),
 ):
     """List all completed conversions for the current user."""
-    converted_files = conv_db.list_files(user_id=current_user["uuid"])
-    converted_files_dict = {f['id']: f for f in converted_files}
-
-    relations = conv_rel_db.list_relations(user_id=current_user["uuid"])
-    # For each relation, create a conversion-centric record with original file metadata from the relation
-    # This uses denormalized data so original files can be deleted without breaking history
-    conversion_records = []
-    for rel in relations:
-        conv_id = rel['converted_file_id']
-        if conv_id in converted_files_dict:
-            record = dict(converted_files_dict[conv_id])
-            # Build original_file metadata from denormalized relation data
-            record['original_file'] = {
-                'id': rel['original_file_id'],
-                'original_filename': rel['original_filename'],
-                'media_type': rel['original_media_type'],
-                'extension': rel['original_extension'],
-                'size_bytes': rel['original_size_bytes']
-            }
-            conversion_records.append(record)
-    
-    return {"conversions": conversion_records}
+    # Original file metadata comes from the denormalized relation rows, so
+    # original files can be deleted without breaking history. The relations
+    # dependency guarantees the joined table exists.
+    return {"conversions": conv_db.list_files_with_relations(user_id=current_user["uuid"])}
 
 
 @router.post(
@@ -152,10 +134,8 @@ def delete_all_conversions(
     current_user: dict = Depends(get_current_active_user),
 ):
     """Delete all converted files and their relations for the current user"""
-    converted_files = conversion_db.list_files(user_id=current_user["uuid"])
-    for file in converted_files:
-        delete_file_and_metadata(file['id'], conversion_db)
-        conversion_relations_db.delete_relation_by_converted(file['id'])
+    delete_all_files_and_metadata(current_user["uuid"], conversion_db)
+    conversion_relations_db.delete_relations_by_user(current_user["uuid"])
     return {"message": "All conversion history deleted successfully"}
 
 @router.delete(
@@ -1,14 +1,17 @@
+import io
 import os
 import uuid
 import hashlib
 import mimetypes
 import logging
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import FileResponse
-from zipfile import ZipFile
+from fastapi import APIRouter, File, UploadFile, HTTPException, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import Iterator
+from zipfile import ZipFile, ZipInfo
 from pathlib import Path
-from core import get_settings, detect_media_type, sanitize_extension, sanitize_filename, delete_file_and_metadata, validate_safe_path, get_file_extension
+from core import get_settings, detect_media_type, sanitize_extension, sanitize_filename, delete_file_and_metadata, delete_all_files_and_metadata, validate_safe_path, get_file_extension
 from db import FileDB, ConversionDB, CompressionDB
 from registry import registry as converter_registry
 from api.deps import get_current_active_user, get_file_db, get_conversion_db, get_compression_db
@@ -23,11 +26,17 @@ router = APIRouter(prefix="/files", tags=["files"])
 
 UNSUPPORTED_UPLOAD_DETAIL = "File has no supported conversions for the detected media type"
 
+# Uploads are streamed to disk in 4 MiB chunks, which keeps the number of
+# read()/write() round trips per upload low without holding much in memory.
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+# Stored files never change once written (each has a fresh UUID name), but
+# the client must still revalidate so deleted files are not served stale.
+DOWNLOAD_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
 # Define upload directory
 settings = get_settings()
 UPLOAD_DIR = settings.upload_dir
 CONVERTED_DIR = settings.output_dir
-TMP_DIR = settings.tmp_dir
 
 
 def resolve_downloaded_media_type(downloader: object, detected_media_type: str) -> str:
@@ -45,6 +54,14 @@ def resolve_downloaded_media_type(downloader: object, detected_media_type: str)
     return detected_media_type
 
 
+def _write_all(fd: int, data: bytes | memoryview) -> None:
+    """Write every byte of data to a raw file descriptor."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 def build_zip_entry_name(file_metadata: dict, is_converted_file: bool) -> str:
     """Build a safe ZIP entry name, preserving converted output extensions."""
     original_name = file_metadata.get("original_filename", "download")
@@ -61,30 +78,48 @@ def build_zip_entry_name(file_metadata: dict, is_converted_file: bool) -> str:
     return sanitize_filename(converted_name)
 
 
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True when an If-None-Match header value matches ``etag``."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 async def save_file(file: UploadFile, db: FileDB, user_id: str) -> dict:
     """Save an uploaded file to disk and store its metadata in the database."""
-    uuid_str = str(uuid.uuid4())
+    uuid_str = uuid.uuid4().hex
     original_filename = file.filename or "upload"
     file_extension = get_file_extension(original_filename)
     unique_filename = f"{uuid_str}"
     if file_extension:
         unique_filename += f".{file_extension}"
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
 
     file_path = Path(UPLOAD_DIR) / unique_filename
     hasher = hashlib.sha256()
     size_bytes = 0
-    # Stream upload to disk and compute hash in one pass
-    with file_path.open("wb") as buffer:
-        while True:
-            chunk = await file.read(1024 * 1024)  # Read in 1MB chunks
-            if not chunk:
-                break
-            buffer.write(chunk)
+    # Stream upload to disk and compute hash in one pass. Chunks are written
+    # straight to the file descriptor; a Python-level write buffer would
+    # only add a copy since every chunk is already large. Reading into one
+    # reused buffer avoids allocating a fresh bytes object per chunk.
+    buffer = bytearray(UPLOAD_CHUNK_SIZE)
+    view = memoryview(buffer)
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while bytes_read := await run_in_threadpool(file.file.readinto, buffer):
+            chunk = view[:bytes_read]
+            _write_all(fd, chunk)
             hasher.update(chunk)
-            size_bytes += len(chunk)
-    
-    media_type = detect_media_type(file_path)
+            size_bytes += bytes_read
+    finally:
+        os.close(fd)
+
+    # Media detection (PyMuPDF for PDFs, libmagic for extensionless files)
+    # and the SQLite insert block, so keep them off the event loop.
+    media_type = await run_in_threadpool(detect_media_type, file_path)
 
     compatible_formats = converter_registry.get_compatible_formats_and_qualities(media_type)
     if not compatible_formats:
@@ -101,7 +136,7 @@ async def save_file(file: UploadFile, db: FileDB, user_id: str) -> dict:
         "sha256_checksum": hasher.hexdigest(),
         "user_id": user_id,
     }
-    db.insert_file_metadata(metadata)
+    await run_in_threadpool(db.insert_file_metadata, metadata)
     metadata["compatible_formats"] = compatible_formats
     return metadata
 
@@ -168,7 +203,7 @@ async def save_files_from_url(url: str, db: FileDB, user_id: str) -> list[dict]:
     A URL may resolve to multiple files (e.g. a yt-dlp playlist); each is
     persisted separately and returned as its own metadata dict.
     """
-    uuid_str = str(uuid.uuid4())
+    uuid_str = uuid.uuid4().hex
     downloader = downloader_registry.get_downloader_for_url(url)
 
     try:
@@ -177,9 +212,11 @@ async def save_files_from_url(url: str, db: FileDB, user_id: str) -> list[dict]:
         raise HTTPException(status_code=exc.status_code, detail=str(exc))
 
     metadatas: list[dict] = []
+    compatible_formats_by_id: dict[str, dict] = {}
     for result in results:
         file_extension = get_file_extension(result.original_filename)
-        media_type = resolve_downloaded_media_type(downloader, detect_media_type(result.file_path))
+        detected_media_type = await run_in_threadpool(detect_media_type, result.file_path)
+        media_type = resolve_downloaded_media_type(downloader, detected_media_type)
 
         compatible_formats = converter_registry.get_compatible_formats_and_qualities(media_type)
         if not compatible_formats:
@@ -196,13 +233,17 @@ async def save_files_from_url(url: str, db: FileDB, user_id: str) -> list[dict]:
             "sha256_checksum": result.sha256_checksum,
             "user_id": user_id,
         }
-        db.insert_file_metadata(metadata)
-        metadata["compatible_formats"] = compatible_formats
         metadatas.append(metadata)
+        compatible_formats_by_id[result.id] = compatible_formats
 
     if not metadatas:
         raise HTTPException(status_code=422, detail=UNSUPPORTED_UPLOAD_DETAIL)
 
+    # Playlists can yield many files; persist them in one transaction.
+    await run_in_threadpool(db.insert_many_file_metadata, metadatas)
+    for metadata in metadatas:
+        metadata["compatible_formats"] = compatible_formats_by_id[metadata["id"]]
+
     return metadatas
 
 
@@ -260,6 +301,7 @@ async def upload_file_from_url(
 )
 def get_file(
     file_id: str,
+    request: Request,
     file_db: FileDB = Depends(get_file_db),
     conv_db: ConversionDB = Depends(get_conversion_db),
     comp_db: CompressionDB = Depends(get_compression_db),
@@ -280,17 +322,74 @@ def get_file(
             # like webvideo still download with the correct MIME type.
             ext = sanitize_extension(metadata.get('extension') or metadata['media_type'])
             mime_type = mimetypes.guess_type(f"file.{ext}")[0] or "application/octet-stream"
+            # Stat here, while already off the event loop, and hand the result
+            # to FileResponse so it sets Content-Length/Last-Modified without
+            # dispatching its own stat to a worker thread.
+            try:
+                stat_result = file_path.stat()
+            except FileNotFoundError:
+                raise HTTPException(status_code=404, detail="File not found on disk")
+            headers = {"Cache-Control": DOWNLOAD_CACHE_CONTROL}
+            if metadata.get("sha256_checksum"):
+                # The content checksum is a strong validator; a matching
+                # If-None-Match skips sending the body entirely.
+                etag = f'"{metadata["sha256_checksum"]}"'
+                headers["ETag"] = etag
+                if etag_matches(request.headers.get("if-none-match"), etag):
+                    return Response(status_code=304, headers=headers)
             return FileResponse(
                 path=file_path,
                 filename=build_zip_entry_name(metadata, db is not file_db),
-                media_type=mime_type
+                media_type=mime_type,
+                headers=headers,
+                stat_result=stat_result,
             )
     raise HTTPException(status_code=404, detail="File not found")
 
+
+class _ZipStreamBuffer(io.RawIOBase):
+    """Write-only, non-seekable sink that collects ZIP bytes until drained.
+
+    ZipFile detects that the sink cannot seek and falls back to writing
+    data descriptors, so the archive can be produced front to back.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip_stream(entries: list[tuple[Path, str]]) -> Iterator[bytes]:
+    """Yield a ZIP archive of (file_path, arcname) entries as it is built."""
+    sink = _ZipStreamBuffer()
+    with ZipFile(sink, "w") as zip_file:
+        for file_path, arcname in entries:
+            zip_info = ZipInfo.from_file(file_path, arcname=arcname)
+            with file_path.open("rb") as source, zip_file.open(zip_info, "w") as target:
+                while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                    target.write(chunk)
+                    yield sink.drain()
+            yield sink.drain()
+    # Closing the ZipFile writes the central directory.
+    yield sink.drain()
+
+
 @router.post(
         "/batch",
         summary="Batch download converted files",
-        response_class=FileResponse,
+        response_class=StreamingResponse,
         responses={
             200: {
                 "content": {"application/zip": {}},
@@ -304,72 +403,60 @@ def get_file(
 )
 def batch_download_files(
     request: BatchDownloadRequest,
-    background_tasks: BackgroundTasks,
     file_db: FileDB = Depends(get_file_db),
     conv_db: ConversionDB = Depends(get_conversion_db),
     comp_db: CompressionDB = Depends(get_compression_db),
     current_user: dict = Depends(get_current_active_user),
 ):
     """Batch download converted files as a ZIP archive"""
-    # Create temporary ZIP file
-    zip_id = str(uuid.uuid4())
-    zip_path = TMP_DIR / f"{zip_id}.zip"
-    
     seen_names: dict[str, int] = {}
+    entries: list[tuple[Path, str]] = []
+
+    # Resolve and validate every file before streaming starts so a missing
+    # file still produces a clean 404 instead of a truncated archive.
+    for file_id in request.file_ids:
+        found_file_in_db = False
+        is_converted_file = False
+        # Check original, converted, and compressed file databases for the file ID
+        for db in [file_db, conv_db, comp_db]:
+            file_metadata = db.get_file_metadata(file_id)
+            if file_metadata is not None:
+                # Verify the file belongs to the current user
+                if file_metadata.get("user_id") != current_user["uuid"]:
+                    file_metadata = None
+                    continue
+                found_file_in_db = True
+                is_converted_file = db is not file_db
+                break
 
-    with ZipFile(zip_path, "w") as zip_file:
-        for file_id in request.file_ids:
-            found_file_in_db = False
-            is_converted_file = False
-            # Check original, converted, and compressed file databases for the file ID
-            for db in [file_db, conv_db, comp_db]:
-                file_metadata = db.get_file_metadata(file_id)
-                if file_metadata is not None:
-                    # Verify the file belongs to the current user
-                    if file_metadata.get("user_id") != current_user["uuid"]:
-                        file_metadata = None
-                        continue
-                    found_file_in_db = True
-                    is_converted_file = db is not file_db
-                    break
-            
-            if not found_file_in_db:
-                # Clean up temp file before raising error
-                if zip_path.exists():
-                    os.unlink(zip_path)
-                raise HTTPException(status_code=404, detail=f"File with id {file_id} not found")
-            
-            file_path = Path(file_metadata['storage_path'])
-            # Validate path before adding to ZIP
-            validate_safe_path(file_path, raise_exception=True)
-            
-            if not file_path.exists():
-                # Clean up temp file before raising error
-                if zip_path.exists():
-                    os.unlink(zip_path)
-                raise HTTPException(status_code=404, detail=f"File with id {file_id} not found on disk")
-            
-            arcname = build_zip_entry_name(file_metadata, is_converted_file)
-            # Deduplicate names when multiple files share the same original filename
-            if arcname in seen_names:
-                seen_names[arcname] += 1
-                stem, _, ext = arcname.rpartition(".")
-                if ext and stem:
-                    arcname = f"{stem} ({seen_names[arcname]}).{ext}"
-                else:
-                    arcname = f"{arcname} ({seen_names[arcname]})"
+        if not found_file_in_db:
+            raise HTTPException(status_code=404, detail=f"File with id {file_id} not found")
+
+        file_path = Path(file_metadata['storage_path'])
+        # Validate path before adding to ZIP
+        validate_safe_path(file_path, raise_exception=True)
+
+        if not file_path.exists():
+            raise HTTPException(status_code=404, detail=f"File with id {file_id} not found on disk")
+
+        arcname = build_zip_entry_name(file_metadata, is_converted_file)
+        # Deduplicate names when multiple files share the same original filename
+        if arcname in seen_names:
+            seen_names[arcname] += 1
+            stem, _, ext = arcname.rpartition(".")
+            if ext and stem:
+                arcname = f"{stem} ({seen_names[arcname]}).{ext}"
             else:
-                seen_names[arcname] = 0
-
-            zip_file.write(file_path, arcname=arcname)
-    
-    # Schedule cleanup of temp ZIP file after response is sent
-    background_tasks.add_task(os.unlink, zip_path)
-    
-    return FileResponse(
-        path=zip_path,
-        filename="transmute_batch_conversion.zip",
-        media_type="application/zip"
+                arcname = f"{arcname} ({seen_names[arcname]})"
+        else:
+            seen_names[arcname] = 0
+
+        entries.append((file_path, arcname))
+
+    return StreamingResponse(
+        iter_zip_stream(entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="transmute_batch_conversion.zip"'},
     )
 
 @router.delete(
@@ -387,9 +474,7 @@ def delete_all_files(
     current_user: dict = Depends(get_current_active_user),
 ):
     """Delete all uploaded files for the current user"""
-    uploaded_files = file_db.list_files(user_id=current_user["uuid"])
-    for file in uploaded_files:
-        delete_file_and_metadata(file['id'], file_db)
+    delete_all_files_and_metadata(current_user["uuid"], file_db)
     return {"message": "All files deleted successfully"}
 
 @router.delete(
@@ -1,13 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from core import get_settings
+from db import FileDB
+from api.deps import get_file_db
 from api.schemas import AppInfo, HealthStatus, ReadinessResponse
-import sqlite3
 import os
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 settings = get_settings()
-DB_PATH = settings.db_path
 UPLOAD_DIR = settings.upload_dir
 
 
@@ -58,14 +58,13 @@ def liveness():
             }
         }
 )
-def readiness():
+def readiness(file_db: FileDB = Depends(get_file_db)):
     """Readiness check to confirm the server is ready to handle requests"""
     checks = {}
-    # SQLite check
+    # SQLite check. Probe through the shared thread-local connection rather
+    # than opening (and tearing down) a fresh one on every poll.
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.execute("SELECT 1")
-        conn.close()
+        file_db.conn.execute("SELECT 1")
         checks["database"] = "ok"
     except Exception as e:
         checks["database"] = f"error: {e}"
@@ -36,11 +36,12 @@ def get_stats(
     users = user_db.list_users()
     user_lookup = {u["uuid"]: u["username"] for u in users}
 
-    all_files = file_db.list_files()
-    all_conversions = conversion_db.list_files()
-    all_compressions = compression_db.list_files()
-    all_conversion_relations = conv_rel_db.list_relations()
-    all_compression_relations = comp_rel_db.list_relations()
+    # Each table is walked once, so stream rows instead of loading them all.
+    all_files = file_db.iter_files()
+    all_conversions = conversion_db.iter_files()
+    all_compressions = compression_db.iter_files()
+    all_conversion_relations = conv_rel_db.iter_relations()
+    all_compression_relations = comp_rel_db.iter_relations()
 
     # Per-user accumulators
     files_count: dict[str, int] = defaultdict(int)
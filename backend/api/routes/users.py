@@ -21,7 +21,7 @@ from api.schemas import (
     UserSelfUpdateRequest,
     UserUpdateRequest,
 )
-from core import delete_file_and_metadata
+from core import delete_all_files_and_metadata
 from core.auth import create_access_token, get_password_hash_str, verify_password
 from db import UserDB, ApiKeyDB, FileDB, ConversionDB, ConversionRelationsDB, SettingsDB, DefaultFormatsDB
 
@@ -400,11 +400,9 @@ def delete_user(
 
     # Cascade: remove all data belonging to the user
     api_key_db.delete_all_keys_for_user(user_uuid)
-    for f in file_db.list_files(user_id=user_uuid):
-        delete_file_and_metadata(f["id"], file_db, raise_if_not_found=False)
-    for c in conversion_db.list_files(user_id=user_uuid):
-        delete_file_and_metadata(c["id"], conversion_db, raise_if_not_found=False)
-        conversion_relations_db.delete_relation_by_converted(c["id"])
+    delete_all_files_and_metadata(user_uuid, file_db)
+    delete_all_files_and_metadata(user_uuid, conversion_db)
+    conversion_relations_db.delete_relations_by_user(user_uuid)
     settings_db.delete_settings(user_uuid)
     default_formats_db.delete_all(user_uuid)
 
@@ -1,45 +1,54 @@
 import logging
-import calendar
 import threading
 import time
 
 from db import FileDB, ConversionDB, ConversionRelationsDB, SettingsDB, DefaultFormatsDB, UserDB, ApiKeyDB
-from core import delete_file_and_metadata
+from core import delete_all_files_and_metadata, delete_stored_files
 
 
 logger = logging.getLogger(__name__)
 
-def file_cleanup_logic(file_db: FileDB, conversion_relations_db: ConversionRelationsDB = None) -> None:
+
+def file_cleanup_logic(
+    file_db: FileDB,
+    conversion_relations_db: ConversionRelationsDB = None,
+    admin_settings: dict | None = None,
+) -> None:
     """Delete files that have exceeded the configured cleanup TTL.
 
-    Reads cleanup settings from the first admin user's configuration.
+    Reads cleanup settings from the first admin user's configuration,
+    unless the caller already fetched them and passes ``admin_settings``.
     Files are cleaned up regardless of user ownership as this is a
     system maintenance task.
     """
     now = time.time()
-    settings_db = SettingsDB()
-    admin_settings = settings_db.get_admin_cleanup_settings()
+    if admin_settings is None:
+        admin_settings = SettingsDB().get_admin_cleanup_settings()
     cleanup_enabled = admin_settings["cleanup_enabled"]
     ttl_minutes = admin_settings["cleanup_ttl_minutes"]
 
     if not cleanup_enabled:
         return
 
-    all_files = file_db.list_files()
-
-    for file in all_files:
-        created_at_timestamp = file.get('created_at')  # Example: 2026-02-28 19:25:43
-        if created_at_timestamp:
-            created_at = calendar.timegm(time.strptime(created_at_timestamp, "%Y-%m-%d %H:%M:%S"))
-            if now - created_at > ttl_minutes * 60:  # If the file was created more than the TTL seconds ago
-                delete_file_and_metadata(file['id'], file_db)
-                if conversion_relations_db:
-                    # Additional cleanup logic for conversion relations
-                    conversion_relations_db.delete_relation_by_converted(file['id'])
-
-def guest_cleanup_logic() -> None:
-    """Delete expired guest users and all their associated data."""
-    user_db = UserDB()
+    # One DELETE removes every row past the TTL; files are unlinked after
+    # the commit.
+    expired = file_db.delete_expired_files_metadata(now - ttl_minutes * 60)
+    expired_ids = [file_id for file_id, _ in expired]
+    delete_stored_files([storage_path for _, storage_path in expired])
+
+    if conversion_relations_db and expired_ids:
+        # Additional cleanup logic for conversion relations
+        conversion_relations_db.delete_relations_by_converted(expired_ids)
+
+def guest_cleanup_logic(user_db: UserDB | None = None) -> None:
+    """Delete expired guest users and all their associated data.
+
+    The remaining DB handles are only opened when there is something to
+    delete; callers running this periodically can pass a long-lived
+    ``user_db`` for the expiry check.
+    """
+    if user_db is None:
+        user_db = UserDB()
     expired_guests = user_db.list_expired_guests()
     if not expired_guests:
         return
@@ -54,11 +63,9 @@ def guest_cleanup_logic() -> None:
     for guest in expired_guests:
         guest_uuid = guest["uuid"]
         api_key_db.delete_all_keys_for_user(guest_uuid)
-        for f in file_db.list_files(user_id=guest_uuid):
-            delete_file_and_metadata(f["id"], file_db, raise_if_not_found=False)
-        for c in conversion_db.list_files(user_id=guest_uuid):
-            delete_file_and_metadata(c["id"], conversion_db, raise_if_not_found=False)
-            conversion_relations_db.delete_relation_by_converted(c["id"])
+        delete_all_files_and_metadata(guest_uuid, file_db)
+        delete_all_files_and_metadata(guest_uuid, conversion_db)
+        conversion_relations_db.delete_relations_by_user(guest_uuid)
         settings_db.delete_settings(guest_uuid)
         default_formats_db.delete_all(guest_uuid)
         user_db.delete_user(guest_uuid)
@@ -71,12 +78,20 @@ def file_cleanup_task() -> None:
     Runs in an infinite loop, invoking file_cleanup_logic for both uploaded
     files (FileDB) and converted files (ConversionDB / ConversionRelationsDB)
     on each iteration, then sleeps for 60 seconds before repeating.
+    The DB handles are opened once and reused for the life of the task, and
+    the admin cleanup settings are read once per iteration and shared by
+    both passes.
     """
+    db_handles = None
     while True:
         try:
-            file_cleanup_logic(FileDB())
-            file_cleanup_logic(ConversionDB(), ConversionRelationsDB())
-            guest_cleanup_logic()
+            if db_handles is None:
+                db_handles = (SettingsDB(), UserDB(), FileDB(), ConversionDB(), ConversionRelationsDB())
+            settings_db, user_db, file_db, conversion_db, conversion_relations_db = db_handles
+            admin_settings = settings_db.get_admin_cleanup_settings()
+            file_cleanup_logic(file_db, admin_settings=admin_settings)
+            file_cleanup_logic(conversion_db, conversion_relations_db, admin_settings=admin_settings)
+            guest_cleanup_logic(user_db)
         except Exception:
             logger.exception("Cleanup error")
         time.sleep(60) # Sleep for 1 minute
@@ -458,18 +458,20 @@ class FFmpegCompressor(CompressorInterface):
         try:
             # Subprocess is safe here because the input file path is validated
             # and the command is constructed without user input.
+            # stdout is unused (output goes to a file); stderr is kept as raw
+            # bytes and only decoded when reporting a failure.
             subprocess.run(  # nosec B603
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
                 check=True,
                 timeout=timeout_seconds,
             )
         except subprocess.CalledProcessError as exc:
             if os.path.exists(tmp_output):
                 os.remove(tmp_output)
-            raise RuntimeError(f"FFmpeg compression failed: {exc.stderr}")
+            # The error FFmpeg reports is at the end of its log output
+            raise RuntimeError(f"FFmpeg compression failed: {exc.stderr[-4096:].decode('utf-8', 'replace')}")
         except subprocess.TimeoutExpired:
             if os.path.exists(tmp_output):
                 os.remove(tmp_output)
@@ -12,6 +12,9 @@ import pillow_jxl   # noqa: F401 — registers JPEG XL plugin on import
 from core import get_settings
 from .compressor_interface import CompressorInterface
 
+# HEIF/HEIC support is process-wide, so register it once at import.
+HeifImagePlugin.register_heif_opener()
+
 
 # Encoder quality value (0-100, higher = better quality / larger file)
 # keyed by compression-level preset. Used by the lossy encoders.
@@ -84,7 +87,6 @@ class PillowCompressor(CompressorInterface):
             media_type: Image format (e.g., 'jpeg', 'png', 'webp').
         """
         super().__init__(input_file, output_dir, media_type)
-        HeifImagePlugin.register_heif_opener()
 
     def can_compress(self) -> bool:
         """
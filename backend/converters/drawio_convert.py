@@ -27,6 +27,12 @@ class DrawioConverter(ConverterInterface):
         'win32': 'C:\\Program Files\\draw.io\\draw.io.exe',
     }
     drawio_path = drawio_paths.get(sys.platform, 'drawio')
+    # Every valid (input, output) pair, so can_convert is a single lookup.
+    _valid_pairs = frozenset(
+        ('drawio', output_fmt)
+        for output_fmt in supported_output_formats
+        if output_fmt != 'drawio'
+    )
     
     def __init__(self, input_file: str, output_dir: str, input_type: str, output_type: str):
         """
@@ -63,22 +69,8 @@ class DrawioConverter(ConverterInterface):
         Returns:
             True if conversion is possible, False otherwise
         """
-        input_fmt = self.input_type.lower()
-        output_fmt = self.output_type.lower()
-        
-        # Check if formats are supported
-        if input_fmt not in self.supported_input_formats or output_fmt not in self.supported_output_formats:
-            return False
-        
-        # Can only convert FROM drawio to other formats
-        if input_fmt != 'drawio':
-            return False
-            
-        # Cannot convert drawio to drawio
-        if output_fmt == 'drawio':
-            return False
-        
-        return True
+        # Can only convert FROM drawio, and never drawio to drawio
+        return (self.input_type.lower(), self.output_type.lower()) in self._valid_pairs
 
     @classmethod
     def get_formats_compatible_with(cls, format_type: str) -> set:
@@ -163,10 +155,12 @@ class DrawioConverter(ConverterInterface):
             # Run the conversion
             # Subprocess is safe here because the input file path is validated
             # and the command is constructed without user input.
+            # stdout is unused; stderr is kept as raw bytes and only decoded
+            # when reporting a failure.
             result = subprocess.run( # nosec B603
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True,
                 timeout=30  # 30 second timeout to prevent hanging
             )
@@ -176,14 +170,13 @@ class DrawioConverter(ConverterInterface):
                 raise RuntimeError(
                     f"Output file was not created: {output_file}\n"
                     f"Command: {' '.join(cmd)}\n"
-                    f"Stdout: {result.stdout}\n"
-                    f"Stderr: {result.stderr}"
+                    f"Stderr: {result.stderr.decode('utf-8', 'replace')}"
                 )
             
             return [output_file]
             
         except subprocess.CalledProcessError as e:
-            error_msg = f"Drawio conversion failed: {e.stderr or e.stdout or str(e)}"
+            error_msg = f"Drawio conversion failed: {(e.stderr or b'').decode('utf-8', 'replace') or str(e)}"
             raise RuntimeError(error_msg)
         except Exception as e:
             error_msg = f"Drawio conversion failed: {str(e)}"
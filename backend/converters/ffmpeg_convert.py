@@ -11,6 +11,9 @@ from typing import Optional
 from .converter_interface import ConverterInterface
 from core import validate_safe_path
 
+# Animated image formats contain no audio stream.
+_ANIMATED_IMAGE_ONLY_FORMATS = frozenset({'apng', 'gif', 'fli', 'flc', 'webp'})
+
 class FFmpegConverter(ConverterInterface):
     video_formats: set = {
         'mp4',
@@ -137,10 +140,8 @@ class FFmpegConverter(ConverterInterface):
         if input_is_audio and output_is_video:
             return False
         
-        # Animated image formats contain no audio stream.
-        # Extracting audio from them is not possible.
-        _animated_image_only_formats = {'apng', 'gif', 'fli', 'flc', 'webp'}
-        if self.input_type in _animated_image_only_formats and self.output_type in self.audio_formats:
+        # Extracting audio from animated images is not possible.
+        if self.input_type in _ANIMATED_IMAGE_ONLY_FORMATS and self.output_type in self.audio_formats:
             return False
         
         # All other conversions are valid:
@@ -320,8 +321,7 @@ class FFmpegConverter(ConverterInterface):
         if fmt in cls.audio_formats:
             # For audio formats, compatible formats are other audio formats
             return (cls.audio_formats - cls._decode_only_formats) - {fmt}
-        _animated_image_only_formats = {'apng', 'gif', 'fli', 'flc', 'webp'}
-        if fmt in _animated_image_only_formats:
+        if fmt in _ANIMATED_IMAGE_ONLY_FORMATS:
             # Animated images have no audio stream — only video targets
             return (cls.video_formats - cls._decode_only_formats - {fmt})
         else:
@@ -463,18 +463,20 @@ class FFmpegConverter(ConverterInterface):
         try:
             # Subprocess is safe here because the input file path is validated
             # and the command is constructed without user input.
+            # stdout is unused (output goes to a file); stderr is kept as raw
+            # bytes and only decoded when reporting a failure.
             subprocess.run( # nosec B603
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
                 check=True,
                 timeout=timeout_seconds,
             )
             return [output_file]
             
         except subprocess.CalledProcessError as e:
-            error_msg = f"FFmpeg conversion failed: {e.stderr}"
+            # The error FFmpeg reports is at the end of its log output
+            error_msg = f"FFmpeg conversion failed: {e.stderr[-4096:].decode('utf-8', 'replace')}"
             raise RuntimeError(error_msg)
         except subprocess.TimeoutExpired:
             raise RuntimeError(
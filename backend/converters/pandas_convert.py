@@ -8,7 +8,9 @@ import warnings
 from datetime import date, datetime, time
 
 import pandas as pd
+import pyarrow as pa
 import pyreadstat
+from pyarrow import compute as pc, csv as pa_csv, parquet as pa_parquet
 import toons
 import tomli_w
 import vobject
@@ -17,6 +19,39 @@ from pandas.api.types import is_object_dtype, is_scalar
 from typing import Optional
 from .converter_interface import ConverterInterface
 
+# Prefer the libyaml C bindings when PyYAML was built with them. The loader
+# matches yaml.safe_load; the dumper keeps yaml.dump's default representer.
+try:
+    from yaml import CSafeLoader as _YamlLoader, CDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, Dumper as _YamlDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# calamine parses xlsx in Rust instead of building openpyxl cell objects.
+try:
+    import python_calamine  # noqa: F401
+except ImportError:
+    _XLSX_READ_ENGINE = 'openpyxl'
+else:
+    _XLSX_READ_ENGINE = 'calamine'
+
+
+# Rows converted to dicts per yaml.dump call when writing tabular YAML.
+_YAML_RECORDS_CHUNK_ROWS = 10_000
+
+# pd.read_csv's default NA and boolean tokens, so Arrow's CSV reader
+# classifies cells the same way on the CSV -> Parquet fast path.
+_PANDAS_CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null',
+]
+_PANDAS_CSV_TRUE_VALUES = ['True', 'TRUE', 'true']
+_PANDAS_CSV_FALSE_VALUES = ['False', 'FALSE', 'false']
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +74,41 @@ def _structured_data_to_dataframe(data):
     return pd.DataFrame([data])
 
 
+def _load_json_file(path):
+    """Parse a JSON document, using orjson when it is installed.
+
+    Anything orjson rejects (e.g. NaN literals or integers beyond 64 bits)
+    is re-parsed with the stdlib so accepted input does not change.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
+def _dump_json_file(data, path):
+    """Write ``data`` as indented JSON, using orjson when it is installed.
+
+    The stdlib encoder is pure Python once ``indent`` is set; values orjson
+    cannot serialize fall back to it.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            with open(path, 'wb') as f:
+                f.write(encoded)
+            return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
 def _to_toml_document(data):
     if isinstance(data, dict):
         return data
@@ -176,6 +246,66 @@ def _prepare_dataframe_for_arrow(df):
     return prepared
 
 
+def _write_records_to_parquet(data, output_file) -> bool:
+    """Write a uniform list of flat records straight to Parquet via Arrow.
+
+    Every record must have the same keys, and every column must infer to a
+    type the DataFrame path would write the same way (see
+    ``_arrow_column_matches_pandas``). Anything else (ragged or nested
+    records, mixed-type columns, integers with nulls, dates) returns False
+    so the caller can go through pandas. The pandas schema metadata the
+    DataFrame path embeds is not written.
+    """
+    if not isinstance(data, list) or not data or not all(isinstance(row, dict) for row in data):
+        return False
+    first_keys = data[0].keys()
+    if any(row.keys() != first_keys for row in data):
+        return False
+    try:
+        table = pa.Table.from_pylist(data)
+    except (pa.ArrowInvalid, TypeError, OverflowError):
+        # ArrowTypeError subclasses TypeError; non-string keys raise it too
+        return False
+    return _write_arrow_table_like_pandas(table, output_file)
+
+
+def _arrow_column_matches_pandas(column) -> bool:
+    """Whether an Arrow-inferred column has the type the DataFrame path gives it.
+
+    Arrow keeps int64 for integers with nulls where pandas widens to
+    float64, infers dates and times from CSV text where pandas keeps
+    strings, and falls back to double for CSV integers past int64 where
+    pandas uses uint64 or strings. Only strings, booleans, null-free int64
+    and int64-range doubles are accepted.
+    """
+    column_type = column.type
+    if pa.types.is_string(column_type) or pa.types.is_boolean(column_type):
+        return True
+    if pa.types.is_int64(column_type):
+        return column.null_count == 0
+    if pa.types.is_float64(column_type):
+        largest = pc.max(pc.abs(column)).as_py()
+        return largest is None or largest < 2 ** 63
+    return False
+
+
+def _write_arrow_table_like_pandas(table, output_file) -> bool:
+    """Write table to Parquet with the schema the DataFrame path would use.
+
+    Returns False without writing when a column's type differs from what
+    pandas would produce. String columns are widened to ``large_string``,
+    which is how pandas writes them.
+    """
+    if not all(_arrow_column_matches_pandas(column) for column in table.columns):
+        return False
+    schema = pa.schema([
+        field.with_type(pa.large_string()) if pa.types.is_string(field.type) else field
+        for field in table.schema
+    ])
+    pa_parquet.write_table(table.cast(schema), output_file)
+    return True
+
+
 def _prepare_dataframe_for_output(df, output_type):
     if output_type in {'parquet', 'feather', 'orc'}:
         return _prepare_dataframe_for_arrow(df)
@@ -272,7 +402,48 @@ class PandasConverter(ConverterInterface):
                 category=UserWarning,
                 module='openpyxl\\.worksheet\\._reader',
             )
-            return pd.read_excel(self.input_file)
+            return pd.read_excel(self.input_file, engine=_XLSX_READ_ENGINE)
+
+    def _read_delimited(self, **kwargs):
+        # Memory-map the input so the C parser reads from the page cache; mmap
+        # rejects empty files, which should still raise pandas' EmptyDataError.
+        memory_map = os.path.getsize(self.input_file) > 0
+        return pd.read_csv(self.input_file, memory_map=memory_map, **kwargs)
+
+    def _convert_delimited_to_parquet(self, output_file: str) -> bool:
+        """
+        Convert CSV/TSV straight to Parquet through Arrow, skipping pandas.
+        
+        Null and boolean tokens follow ``pd.read_csv``'s defaults and
+        timestamp inference is disabled. The table is only written when
+        every column holds a type both readers agree on (see
+        ``_write_arrow_table_like_pandas``). Anything else (dates, times,
+        integers with blanks, ragged rows, duplicate headers) is left to
+        the pandas path. The pandas schema metadata is not written.
+        
+        Returns:
+            True if the output file was written, False to fall back.
+        """
+        delimiter = '\t' if self.input_type == 'tsv' else ','
+        try:
+            # A memory-mapped source lets Arrow parse straight from the page cache.
+            with pa.memory_map(self.input_file) as source:
+                table = pa_csv.read_csv(
+                    source,
+                    parse_options=pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+                    convert_options=pa_csv.ConvertOptions(
+                        null_values=_PANDAS_CSV_NA_VALUES,
+                        true_values=_PANDAS_CSV_TRUE_VALUES,
+                        false_values=_PANDAS_CSV_FALSE_VALUES,
+                        timestamp_parsers=[],
+                        strings_can_be_null=True,
+                    ),
+                )
+        except pa.ArrowInvalid:
+            return False
+        if len(set(table.column_names)) != len(table.column_names):
+            return False
+        return _write_arrow_table_like_pandas(table, output_file)
 
     def convert(self, overwrite: bool = True, quality: Optional[str] = None) -> list[str]:
         """
@@ -296,11 +467,15 @@ class PandasConverter(ConverterInterface):
         if os.path.exists(output_file) and not overwrite:
             raise FileExistsError(f"Output file {output_file} already exists and overwrite is set to False.")
         
+        if self.input_type in ('csv', 'tsv') and self.output_type == 'parquet':
+            if self._convert_delimited_to_parquet(output_file):
+                return [output_file]
+
         # Handle structured document conversions directly to preserve nested structure.
         if self.input_type in ['yaml', 'json', 'toml', 'toon'] and self.output_type in ['yaml', 'json', 'toml', 'toon']:
             if self.input_type == 'yaml':
                 with open(self.input_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=_YamlLoader)  # nosec B506 - safe loader
             elif self.input_type == 'toml':
                 with open(self.input_file, 'rb') as f:
                     data = tomllib.load(f)
@@ -308,12 +483,11 @@ class PandasConverter(ConverterInterface):
                 with open(self.input_file, 'r', encoding='utf-8') as f:
                     data = toons.load(f)
             else:  # json
-                with open(self.input_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json_file(self.input_file)
             
             if self.output_type == 'yaml':
                 with open(output_file, 'w', encoding='utf-8') as f:
-                    yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+                    yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
             elif self.output_type == 'toml':
                 with open(output_file, 'wb') as f:
                     tomli_w.dump(_to_toml_compatible(_to_toml_document(data)), f)
@@ -321,20 +495,20 @@ class PandasConverter(ConverterInterface):
                 with open(output_file, 'w', encoding='utf-8') as f:
                     toons.dump(_to_string_keyed_data(data), f)
             else:  # json
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+                _dump_json_file(data, output_file)
             
             return [output_file]
         
         # For tabular conversions, use pandas
         df = None
         if self.input_type == 'csv':
-            df = pd.read_csv(self.input_file)
+            df = self._read_delimited()
         elif self.input_type == 'xlsx':
             df = self._read_xlsx()
         elif self.input_type == 'json':
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(self.input_file)
+            if self.output_type == 'parquet' and _write_records_to_parquet(data, output_file):
+                return [output_file]
             df = _structured_data_to_dataframe(data)
         elif self.input_type == 'parquet':
             df = pd.read_parquet(self.input_file)
@@ -343,7 +517,7 @@ class PandasConverter(ConverterInterface):
         elif self.input_type == 'orc':
             df = pd.read_orc(self.input_file)
         elif self.input_type == 'tsv':
-            df = pd.read_csv(self.input_file, sep='\t')
+            df = self._read_delimited(sep='\t')
         elif self.input_type == 'xml':
             df = pd.read_xml(self.input_file)
         elif self.input_type == 'html':
@@ -401,7 +575,9 @@ class PandasConverter(ConverterInterface):
             df = pd.DataFrame(rows, columns=['key', 'value'])
         elif self.input_type == 'yaml':
             with open(self.input_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)  # nosec B506 - safe loader
+            if self.output_type == 'parquet' and _write_records_to_parquet(data, output_file):
+                return [output_file]
             df = _structured_data_to_dataframe(data)
         elif self.input_type == 'vcf':
             with open(self.input_file, 'r', encoding='utf-8') as f:
@@ -462,7 +638,16 @@ class PandasConverter(ConverterInterface):
             df.to_excel(output_file, engine='odf', index=False)
         elif self.output_type == 'yaml':
             with open(output_file, 'w', encoding='utf-8') as f:
-                yaml.dump(df.to_dict(orient='records'), f, default_flow_style=False)
+                if df.empty:
+                    # No rows, or rows without columns: to_dict() gives [] for
+                    # every slice, and repeated "[]" documents are not YAML.
+                    yaml.dump([], f, Dumper=_YamlDumper, default_flow_style=False)
+                else:
+                    # Block sequences concatenate into one sequence, so emit the
+                    # records in slices instead of materializing every row dict.
+                    for start in range(0, len(df), _YAML_RECORDS_CHUNK_ROWS):
+                        chunk = df.iloc[start:start + _YAML_RECORDS_CHUNK_ROWS]
+                        yaml.dump(chunk.to_dict(orient='records'), f, Dumper=_YamlDumper, default_flow_style=False)
         elif self.output_type == 'toml':
             with open(output_file, 'wb') as f:
                 tomli_w.dump(_to_toml_compatible({'data': df.to_dict(orient='records')}), f)
@@ -9,6 +9,9 @@ import pillow_avif  # noqa: F401 — registers AVIF plugin on import
 import pillow_jxl   # noqa: F401 — registers JPEG XL plugin on import
 from .converter_interface import ConverterInterface
 
+# Register the HEIF/HEIC opener once per process rather than per conversion.
+HeifImagePlugin.register_heif_opener()
+
 try:
     if sys.platform == 'darwin':
         # Homebrew installs Cairo to paths not searched by default.
@@ -26,6 +29,35 @@ import shutil
 _GHOSTSCRIPT_AVAILABLE = shutil.which('gs') is not None or shutil.which('gswin32c') is not None
 
 
+def _rasterize_svg(path: str) -> Image.Image:
+    """
+    Rasterize an SVG file to an RGBA image with cairosvg.
+    
+    The pixels are read straight from the cairo image surface rather than
+    through svg2png, which would compress a PNG only for Pillow to
+    decompress it again.
+    """
+    if sys.byteorder != 'little':
+        # Cairo stores ARGB32 pixels in native byte order; the raw 'BGRa'
+        # layout below only holds on little-endian hosts.
+        return Image.open(BytesIO(cairosvg.svg2png(url=path)))
+    tree = cairosvg.parser.Tree(url=path)
+    surface = cairosvg.surface.PNGSurface(tree, None, 96)
+    cairo_surface = surface.cairo
+    cairo_surface.flush()
+    # Cairo pixels are premultiplied; Pillow's 'BGRa' unpacker undoes that.
+    img = Image.frombytes(
+        'RGBA',
+        (cairo_surface.get_width(), cairo_surface.get_height()),
+        bytes(cairo_surface.get_data()),
+        'raw',
+        'BGRa',
+        cairo_surface.get_stride(),
+    )
+    surface.finish()
+    return img
+
+
 class PillowConverter(ConverterInterface):
     supported_input_formats: set = {
         'jpeg',
@@ -120,7 +152,6 @@ class PillowConverter(ConverterInterface):
             output_type: Output file format (e.g., 'jpg', 'png', 'bmp')
         """
         super().__init__(input_file, output_dir, input_type, output_type)
-        HeifImagePlugin.register_heif_opener()
     
     def can_convert(self) -> bool:
         """
@@ -211,9 +242,8 @@ class PillowConverter(ConverterInterface):
                         "cairosvg is required for SVG conversion but could not be loaded. "
                         "Install Cairo (e.g. `brew install cairo`) and cairosvg (`pip install cairosvg`)."
                     )
-                # Convert SVG to PNG with transparency using cairosvg
-                png_data = cairosvg.svg2png(url=self.input_file)
-                img = Image.open(BytesIO(png_data))
+                # Rasterize SVG with transparency using cairosvg
+                img = _rasterize_svg(self.input_file)
             elif input_fmt == 'eps':
                 if not _GHOSTSCRIPT_AVAILABLE:
                     raise RuntimeError(
@@ -266,7 +296,8 @@ class PillowConverter(ConverterInterface):
                     background = Image.new('RGB', img.size, (255, 255, 255))
                     if img.mode == 'LA':
                         img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1])  # Use alpha channel as mask
+                    # getchannel only extracts the alpha band; split() copies every band
+                    background.paste(img, mask=img.getchannel('A'))
                     img = background
 
             # MSP and XBM only support 1-bit pixels
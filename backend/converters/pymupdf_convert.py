@@ -14,6 +14,8 @@ import pillow_jxl   # noqa: F401 — registers JPEG XL plugin on import
 
 from .converter_interface import ConverterInterface
 
+HeifImagePlugin.register_heif_opener()
+
 
 # Raster image output formats supported via PyMuPDF page rendering + Pillow
 # encoding. Multi-page PDFs produce one image per page; the service layer
@@ -383,8 +385,6 @@ class PyMuPDFConverter(ConverterInterface):
         self, overwrite: bool, quality: Optional[str]
     ) -> list[str]:
         """Render every page of the PDF to a raster image file."""
-        HeifImagePlugin.register_heif_opener()
-
         dpi = _RASTER_QUALITY_DPI.get((quality or '').lower(), _DEFAULT_RASTER_DPI)
         save_kwargs = self._get_pillow_save_kwargs(self.output_type, quality)
         pillow_format = _PILLOW_FORMAT_NAMES.get(self.output_type, self.output_type.upper())
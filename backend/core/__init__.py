@@ -6,15 +6,22 @@ from .domain_auth import get_domain_auth_for_url, reload_domain_auth_cache
 from .helper_functions import (
     assign_orphaned_rows_to_admin,
     compute_sha256_checksum,
+    compute_sha256_checksum_and_size,
     detect_media_type,
     sanitize_extension,
     sanitize_filename,
     delete_file_and_metadata,
+    delete_all_files_and_metadata,
+    delete_stored_files,
     validate_sql_identifier,
     validate_safe_path,
     validate_hexadecimal_filename,
     migrate_table_columns,
-    get_file_extension
+    open_sqlite_connection,
+    get_sqlite_connection,
+    release_sqlite_connection,
+    get_file_extension,
+    SQLITE_HAS_RETURNING,
 )
 
 __all__ = [
@@ -23,17 +30,24 @@ __all__ = [
     "configure_logging",
     "get_settings", 
     "compute_sha256_checksum",
+    "compute_sha256_checksum_and_size",
     "detect_media_type", 
     "sanitize_extension", 
     "sanitize_filename",
     "delete_file_and_metadata", 
+    "delete_all_files_and_metadata",
+    "delete_stored_files",
     "media_type_aliases",
     "media_type_extensions",
     "validate_sql_identifier",
     "validate_safe_path",
     "validate_hexadecimal_filename",
     "migrate_table_columns",
+    "open_sqlite_connection",
+    "get_sqlite_connection",
+    "release_sqlite_connection",
     "get_file_extension",
+    "SQLITE_HAS_RETURNING",
     "get_domain_auth_for_url",
     "reload_domain_auth_cache",
 ]
\ No newline at end of file
@@ -1,9 +1,12 @@
 import os
 import re
 import sqlite3
+import logging
+import threading
 import mimetypes
 import hashlib
 import magic
+from functools import lru_cache
 from defusedxml import ElementTree as DefusedET
 
 from typing import TYPE_CHECKING
@@ -17,7 +20,115 @@ from core.media_types import media_type_extensions
 from core.settings import get_settings
 
 
-def compute_sha256_checksum(file_path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+logger = logging.getLogger(__name__)
+
+# Patterns used on every file operation are compiled once at import time.
+_SQL_IDENTIFIER_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+_HEX_FILENAME_STEM_RE = re.compile(r'^[0-9a-fA-F-]+$')
+# \w covers str.isalnum() characters plus underscore.
+_EXTENSION_DISALLOWED_RE = re.compile(r'[^\w.\-/]')
+# Same whitelist for filenames, plus space; separators/control chars fall out.
+_FILENAME_DISALLOWED_RE = re.compile(r'[^\w.\- ]')
+_WINDOWS_RESERVED_NAMES = frozenset({
+    "CON", "PRN", "AUX", "NUL",
+    "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
+    "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9",
+})
+
+# Per-connection tuning applied by open_sqlite_connection. WAL lets readers
+# (listings, metadata lookups) proceed while an upload or conversion is
+# writing; synchronous=NORMAL is durable under WAL and halves fsyncs.
+_SQLITE_CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-16000",
+)
+
+# sqlite3 keeps an LRU of prepared statements per connection keyed by SQL
+# text. The DB classes build their queries from fixed table names, so every
+# call with the same query reuses its compiled statement; the default of 128
+# is raised so per-table CRUD statements across all tables stay cached.
+_SQLITE_CACHED_STATEMENTS = 256
+
+# UPDATE/DELETE ... RETURNING needs SQLite 3.35+; callers read rows back
+# with a separate statement on older libraries.
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def open_sqlite_connection(db_path: str | Path) -> sqlite3.Connection:
+    """Open a SQLite connection with the app's standard PRAGMA tuning.
+
+    Switches the database to WAL journal mode (skipped for ``:memory:``
+    databases, which cannot use it) and applies the settings in
+    ``_SQLITE_CONNECTION_PRAGMAS``. The prepared-statement cache is sized
+    by ``_SQLITE_CACHED_STATEMENTS``. Implicit transactions opened before
+    INSERT/UPDATE/DELETE start as ``BEGIN IMMEDIATE``, so a ``with conn:``
+    block takes the write lock up front instead of upgrading a read lock
+    mid-transaction, which fails with SQLITE_BUSY without waiting.
+
+    Args:
+        db_path: Path to the SQLite database file, or ``":memory:"``.
+
+    Returns:
+        An open SQLite connection.
+    """
+    conn = sqlite3.connect(
+        db_path,
+        isolation_level="IMMEDIATE",
+        cached_statements=_SQLITE_CACHED_STATEMENTS,
+    )
+    if str(db_path) != ":memory:":
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if str(journal_mode).lower() != "wal":
+            logger.warning("SQLite journal_mode for %s is %r, expected 'wal'", db_path, journal_mode)
+    for pragma in _SQLITE_CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Per-thread connections keyed by database path, shared by every DB class
+# the thread touches so they use one page cache and one WAL reader.
+_thread_sqlite_connections = threading.local()
+
+
+def get_sqlite_connection(db_path: str | Path) -> sqlite3.Connection:
+    """Return the calling thread's shared connection to ``db_path``.
+
+    All DB classes point at the same database file, so a thread reuses one
+    connection for all of them instead of opening one per class. ``:memory:``
+    databases are private to each connection and are never shared.
+
+    Args:
+        db_path: Path to the SQLite database file, or ``":memory:"``.
+
+    Returns:
+        An open SQLite connection, owned by the current thread.
+    """
+    if str(db_path) == ":memory:":
+        return open_sqlite_connection(db_path)
+    connections = getattr(_thread_sqlite_connections, "by_path", None)
+    if connections is None:
+        connections = _thread_sqlite_connections.by_path = {}
+    key = str(db_path)
+    conn = connections.get(key)
+    if conn is None:
+        conn = connections[key] = open_sqlite_connection(db_path)
+    return conn
+
+
+def release_sqlite_connection(db_path: str | Path, conn: sqlite3.Connection) -> None:
+    """Give back a connection obtained from :func:`get_sqlite_connection`.
+
+    Private ``:memory:`` connections are closed. Shared connections stay
+    open for the thread's other DB instances and are closed when the
+    thread exits.
+    """
+    if str(db_path) == ":memory:":
+        conn.close()
+
+
+def compute_sha256_checksum(file_path: str | Path, chunk_size: int = 4 * 1024 * 1024) -> str:
     """Compute a SHA-256 checksum without loading the full file into memory.
 
     Args:
@@ -27,11 +138,35 @@ def compute_sha256_checksum(file_path: str | Path, chunk_size: int = 1024 * 1024
     Returns:
         Hex-encoded SHA-256 digest
     """
+    return compute_sha256_checksum_and_size(file_path, chunk_size)[0]
+
+
+def compute_sha256_checksum_and_size(file_path: str | Path, chunk_size: int = 4 * 1024 * 1024) -> tuple[str, int]:
+    """Compute a SHA-256 checksum and the byte count in a single pass.
+
+    Lets callers that also need the file size skip a separate ``stat`` call.
+
+    Args:
+        file_path: Path to the file to hash
+        chunk_size: Number of bytes to read per iteration
+
+    Returns:
+        Tuple of (hex-encoded SHA-256 digest, size in bytes)
+    """
     hasher = hashlib.sha256()
-    with Path(file_path).open("rb") as file_handle:
-        while chunk := file_handle.read(chunk_size):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    size_bytes = 0
+    # Read into one reused buffer instead of allocating a new bytes object
+    # per chunk; memory use stays at chunk_size regardless of file size.
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with Path(file_path).open("rb", buffering=0) as file_handle:
+        if hasattr(os, "posix_fadvise"):
+            # The file is read once front to back; let the kernel read ahead.
+            os.posix_fadvise(file_handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while bytes_read := file_handle.readinto(buffer):
+            hasher.update(view[:bytes_read])
+            size_bytes += bytes_read
+    return hasher.hexdigest(), size_bytes
 
 
 def assign_orphaned_rows_to_admin(
@@ -118,7 +253,7 @@ def validate_sql_identifier(identifier: str) -> str:
     if not identifier:
         raise ValueError("SQL identifier cannot be empty")
     
-    if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', identifier):
+    if not _SQL_IDENTIFIER_RE.match(identifier):
         raise ValueError(
             f"Invalid SQL identifier '{identifier}'. "
             "Must start with a letter or underscore and contain only alphanumeric characters and underscores."
@@ -209,8 +344,8 @@ def detect_p7m_content_type(file_path: Path) -> str | None:
     """
     Detect the media type of the content embedded inside a PKCS#7/CMS container.
 
-    Extracts the encapsulated content, writes it to a temporary file, and
-    uses libmagic for content-based MIME detection.
+    Extracts the encapsulated content and hands it to libmagic for
+    content-based MIME detection.
 
     Args:
         file_path: Path to the .p7m file
@@ -219,7 +354,6 @@ def detect_p7m_content_type(file_path: Path) -> str | None:
         A lowercase extension string (e.g. "pdf", "xml") or None if
         detection fails.
     """
-    import tempfile
     from converters.pkcs7_convert import PKCS7Converter
 
     try:
@@ -227,17 +361,12 @@ def detect_p7m_content_type(file_path: Path) -> str | None:
         content = PKCS7Converter._extract_content(raw)
         content = PKCS7Converter._extract_recursive(content)
 
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        try:
-            mime = magic.from_file(tmp_path, mime=True)
-            ext = mimetypes.guess_extension(mime) or ""
-            detected = ext.lstrip('.').lower()
-            return detected or None
-        finally:
-            os.unlink(tmp_path)
+        # The content is already in memory; sniff it there rather than
+        # writing a temporary file just to have libmagic read it back.
+        mime = magic.from_buffer(content, mime=True)
+        ext = mimetypes.guess_extension(mime) or ""
+        detected = ext.lstrip('.').lower()
+        return detected or None
     except Exception:
         return None
 
@@ -298,7 +427,7 @@ def sanitize_extension(extension: str) -> str:
     """
     # Keep alphanumerics plus _, -, and ., normalize case.
     cleaned = extension.strip().lstrip(".")
-    return "".join(ch for ch in cleaned if ch.isalnum() or ch in {"_", "-", ".", "/"}).lower()
+    return _EXTENSION_DISALLOWED_RE.sub("", cleaned).lower()
 
 def get_file_extension(filename: str) -> str:
     """
@@ -347,8 +476,13 @@ def validate_hexadecimal_filename(filename: str) -> bool:
     
     # Validate hexadecimal (UUIDs are hex with optional hyphens)
     # Allow both "abc123" and "abc-123-def" formats
-    hex_pattern = re.compile(r'^[0-9a-fA-F-]+$')
-    return bool(hex_pattern.match(stem))
+    return bool(_HEX_FILENAME_STEM_RE.match(stem))
+
+
+@lru_cache(maxsize=8)
+def _resolved_allowed_dirs(upload_dir: Path, tmp_dir: Path, output_dir: Path) -> tuple[Path, ...]:
+    """Resolve the allowed storage directories once per distinct configuration."""
+    return (upload_dir.resolve(), tmp_dir.resolve(), output_dir.resolve())
 
 
 def validate_safe_path(file_path: str | Path, raise_exception: bool = True) -> bool:
@@ -373,25 +507,22 @@ def validate_safe_path(file_path: str | Path, raise_exception: bool = True) -> b
     """
     settings = get_settings()
     
-    # Convert to Path object and resolve to absolute canonical path
-    # This automatically handles .., symlinks, etc.
+    # Resolve to an absolute canonical path; this handles .., symlinks, etc.
+    # os.path.realpath is what Path.resolve uses under the hood, without
+    # building an intermediate Path first.
     try:
-        absolute_path = Path(file_path).resolve(strict=False)
+        absolute_path = Path(os.path.realpath(file_path))
     except (ValueError, RuntimeError) as e:
         if raise_exception:
             raise HTTPException(status_code=400, detail=f"Invalid file path: {e}")
         return False
     
-    # Define allowed directories
-    allowed_dirs = [
-        settings.upload_dir.resolve(),
-        settings.tmp_dir.resolve(),
-        settings.output_dir.resolve()
-    ]
+    allowed_dirs = _resolved_allowed_dirs(settings.upload_dir, settings.tmp_dir, settings.output_dir)
     
-    # Check if path is within any allowed directory
+    # Check if path is within any allowed directory. Compare path components
+    # rather than string prefixes so "uploads_evil" does not match "uploads".
     is_within_allowed = any(
-        str(absolute_path).startswith(str(allowed_dir)) 
+        absolute_path.is_relative_to(allowed_dir)
         for allowed_dir in allowed_dirs
     )
     
@@ -430,26 +561,16 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return "unnamed"
     
-    # Remove any path separators and null bytes
-    cleaned = filename.replace("/", "").replace("\\", "").replace("\0", "")
-    
-    # Remove control characters (ASCII 0-31 and 127)
-    cleaned = "".join(ch for ch in cleaned if ord(ch) >= 32 and ord(ch) != 127)
-    
-    # Whitelist: only alphanumerics, underscore, hyphen, period, and space
-    cleaned = "".join(ch for ch in cleaned if ch.isalnum() or ch in {"_", "-", ".", " "})
+    # Whitelist: only alphanumerics, underscore, hyphen, period, and space.
+    # This also removes path separators, null bytes and control characters.
+    cleaned = _FILENAME_DISALLOWED_RE.sub("", filename)
     
     # Strip leading/trailing dots, spaces, and whitespace
     cleaned = cleaned.strip(". ")
     
     # Check for Windows reserved names (case-insensitive)
-    reserved_names = {
-        "CON", "PRN", "AUX", "NUL",
-        "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
-        "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"
-    }
     name_without_ext = cleaned.split(".")[0].upper()
-    if name_without_ext in reserved_names:
+    if name_without_ext in _WINDOWS_RESERVED_NAMES:
         cleaned = f"_{cleaned}"
     
     # Limit length (255 is typical max for most filesystems, use 200 to be safe)
@@ -499,4 +620,36 @@ def delete_file_and_metadata(file_id: str, file_db: "FileDB", raise_if_not_found
     validate_safe_path(storage_path, raise_exception=True)
     
     os.unlink(storage_path)
-    file_db.delete_file_metadata(file_id)
\ No newline at end of file
+    file_db.delete_file_metadata(file_id)
+
+
+def delete_stored_files(storage_paths: list[str]) -> None:
+    """
+    Remove files from disk whose metadata rows have already been deleted.
+
+    Files whose storage path fails validation are left on disk and logged
+    rather than aborting the batch part-way through; files that are already
+    gone are ignored.
+
+    Args:
+        storage_paths: Storage paths returned by a bulk metadata delete
+    """
+    for storage_path in storage_paths:
+        if not validate_safe_path(storage_path, raise_exception=False):
+            logger.warning("Skipping unlink of unsafe storage path %s", storage_path)
+            continue
+        Path(storage_path).unlink(missing_ok=True)
+
+
+def delete_all_files_and_metadata(user_id: str, file_db: "FileDB") -> None:
+    """
+    Delete every file owned by a user from disk and the database.
+
+    The metadata rows are removed with a single DELETE so the whole purge is
+    one commit instead of one per file.
+
+    Args:
+        user_id: Unique identifier of the user whose files should be deleted
+        file_db: Database instance holding the file metadata
+    """
+    delete_stored_files(file_db.delete_files_metadata_by_user(user_id))
@@ -1,7 +1,8 @@
 import sqlite3
 import threading
-from typing import Optional
-from core import get_settings, validate_sql_identifier, migrate_table_columns, assign_orphaned_rows_to_admin
+from operator import itemgetter
+from typing import Iterator, Optional
+from core import get_settings, validate_sql_identifier, migrate_table_columns, assign_orphaned_rows_to_admin, get_sqlite_connection, release_sqlite_connection
 
 '''
 Anywhere you see # nosec B608, it is marking a Bandit false positive. The table 
@@ -28,6 +29,18 @@ class CompressionRelationsDB:
     settings = get_settings()
     DB_PATH = settings.db_path
     _TABLE_NAME = settings.compression_relations_table_name
+    _REQUIRED_FIELDS = (
+        'original_file_id',
+        'compressed_file_id',
+        'original_filename',
+        'original_media_type',
+        'original_extension',
+        'original_size_bytes',
+        'user_id',
+    )
+    _REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+    # Pulls the insert values out of a metadata dict, in column order
+    _REQUIRED_FIELD_VALUES = itemgetter(*_REQUIRED_FIELDS)
 
     @property
     def TABLE_NAME(self) -> str:
@@ -45,7 +58,7 @@ class CompressionRelationsDB:
     def conn(self) -> sqlite3.Connection:
         """Return a thread-local SQLite connection, creating one if needed."""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(self.DB_PATH)
+            self._local.conn = get_sqlite_connection(self.DB_PATH)
         return self._local.conn
 
     def create_tables(self) -> None:
@@ -74,6 +87,22 @@ class CompressionRelationsDB:
             "user_id":            "TEXT",
         })
 
+        # Lookups and deletes filter on one of these columns; index them so
+        # they stay B-tree probes as the table grows.
+        with self.conn:
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_original_file "  # nosec B608
+                f"ON {self.TABLE_NAME} (original_file_id)"
+            )
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_compressed_file "  # nosec B608
+                f"ON {self.TABLE_NAME} (compressed_file_id)"
+            )
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_user "  # nosec B608
+                f"ON {self.TABLE_NAME} (user_id)"
+            )
+
         # Assign pre-auth orphaned rows to the first admin
         assign_orphaned_rows_to_admin(self.conn, self.TABLE_NAME)
 
@@ -93,28 +122,11 @@ class CompressionRelationsDB:
         Raises:
             ValueError: If the metadata dictionary contains missing or extra fields.
         """
-        required_fields = [
-            'original_file_id',
-            'compressed_file_id',
-            'original_filename',
-            'original_media_type',
-            'original_extension',
-            'original_size_bytes',
-            'user_id'
-        ]
-        if metadata.keys() != set(required_fields):
-            raise ValueError(f"Metadata must contain the following fields: {required_fields}. Missing or extra fields: {set(required_fields).symmetric_difference(metadata.keys())}")
+        if metadata.keys() != self._REQUIRED_FIELD_SET:
+            raise ValueError(f"Metadata must contain the following fields: {list(self._REQUIRED_FIELDS)}. Missing or extra fields: {metadata.keys() ^ self._REQUIRED_FIELD_SET}")
         with self.conn:
             # nosec B608
-            self.conn.execute(f"INSERT INTO {self.TABLE_NAME} (original_file_id, compressed_file_id, original_filename, original_media_type, original_extension, original_size_bytes, user_id) VALUES (?, ?, ?, ?, ?, ?, ?)", (  # nosec B608
-                metadata['original_file_id'],
-                metadata['compressed_file_id'],
-                metadata['original_filename'],
-                metadata['original_media_type'],
-                metadata['original_extension'],
-                metadata['original_size_bytes'],
-                metadata['user_id'],
-            ))
+            self.conn.execute(f"INSERT INTO {self.TABLE_NAME} (original_file_id, compressed_file_id, original_filename, original_media_type, original_extension, original_size_bytes, user_id) VALUES (?, ?, ?, ?, ?, ?, ?)", self._REQUIRED_FIELD_VALUES(metadata))  # nosec B608
 
     def get_compression_from_file(self, original_file_id: str) -> Optional[str]:
         """Retrieve the compressed file ID associated with an original file.
@@ -126,13 +138,13 @@ class CompressionRelationsDB:
             The compressed file ID as a string, or None if no relation exists
             for the given original file ID.
         """
-        cursor = self.conn.cursor()
-        cursor.row_factory = sqlite3.Row
-        cursor.execute(f"SELECT * FROM {self.TABLE_NAME} WHERE original_file_id = ?", (original_file_id,))  # nosec B608
-        row = cursor.fetchone()
+        row = self.conn.execute(
+            f"SELECT compressed_file_id FROM {self.TABLE_NAME} WHERE original_file_id = ? LIMIT 1",  # nosec B608
+            (original_file_id,),
+        ).fetchone()
         if row is None:
             return None
-        return row['compressed_file_id']
+        return row[0]
 
     def get_original_from_compression(self, compressed_file_id: str) -> Optional[str]:
         """Retrieve the original file ID associated with a compressed file.
@@ -144,13 +156,13 @@ class CompressionRelationsDB:
             The original file ID as a string, or None if no relation exists
             for the given compressed file ID.
         """
-        cursor = self.conn.cursor()
-        cursor.row_factory = sqlite3.Row
-        cursor.execute(f"SELECT * FROM {self.TABLE_NAME} WHERE compressed_file_id = ?", (compressed_file_id,))  # nosec B608
-        row = cursor.fetchone()
+        row = self.conn.execute(
+            f"SELECT original_file_id FROM {self.TABLE_NAME} WHERE compressed_file_id = ? LIMIT 1",  # nosec B608
+            (compressed_file_id,),
+        ).fetchone()
         if row is None:
             return None
-        return row['original_file_id']
+        return row[0]
 
     def delete_relation_by_original(self, original_file_id: str) -> None:
         """Delete all compression relations associated with an original file.
@@ -172,19 +184,37 @@ class CompressionRelationsDB:
         with self.conn:
             self.conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE compressed_file_id = ?", (compressed_file_id,))  # nosec B608
 
+    def delete_relations_by_user(self, user_id: str) -> None:
+        """Delete all compression relations owned by a user.
+
+        Args:
+            user_id: The unique identifier of the user whose relations
+                should be deleted.
+        """
+        with self.conn:
+            self.conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE user_id = ?", (user_id,))  # nosec B608
+
     def list_relations(self, user_id: str | None = None) -> list[dict]:
         """Retrieve compression relations, optionally filtered by user."""
+        return list(self.iter_relations(user_id))
+
+    def iter_relations(self, user_id: str | None = None) -> Iterator[dict]:
+        """Yield compression relations one row at a time, optionally filtered by user.
+
+        Rows are fetched lazily from an open statement, so consume the
+        iterator fully on the thread that created it.
+        """
         cursor = self.conn.cursor()
         cursor.row_factory = sqlite3.Row
         if user_id is not None:
             cursor.execute(f"SELECT * FROM {self.TABLE_NAME} WHERE user_id = ?", (user_id,))  # nosec B608
         else:
             cursor.execute(f"SELECT * FROM {self.TABLE_NAME}")  # nosec B608
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        for row in cursor:
+            yield dict(row)
 
     def close(self) -> None:
-        """Close the current thread's database connection."""
+        """Release the current thread's database connection."""
         if hasattr(self._local, 'conn') and self._local.conn:
-            self._local.conn.close()
+            release_sqlite_connection(self.DB_PATH, self._local.conn)
             self._local.conn = None
@@ -1,4 +1,5 @@
-from core import get_settings, migrate_table_columns
+import sqlite3
+from core import get_settings, migrate_table_columns, validate_sql_identifier
 from .file_db import FileDB
 
 
@@ -13,14 +14,18 @@ class ConversionDB(FileDB):
         settings: Application settings instance.
         DB_PATH: Path to the SQLite database file.
         _TABLE_NAME: Name of the database table for conversion file metadata.
+        _RELATIONS_TABLE_NAME: Name of the conversion relations table joined
+            by list_files_with_relations.
     """
 
     settings = get_settings()
     DB_PATH = settings.db_path
     _TABLE_NAME = settings.conversion_table_name
+    _RELATIONS_TABLE_NAME = settings.conversion_relations_table_name
 
     def __init__(self) -> None:
         """Initialize ConversionDB and create the conversions table."""
+        object.__setattr__(self, '_relations_table_name', validate_sql_identifier(self._RELATIONS_TABLE_NAME))
         super().__init__()
         self._ensure_quality_column()
 
@@ -45,3 +50,48 @@ class ConversionDB(FileDB):
                     f"UPDATE {self.TABLE_NAME} SET quality = ? WHERE id = ?",  # nosec B608
                     (quality, metadata['id']),
                 )
+
+    def list_files_with_relations(self, user_id: str) -> list[dict]:
+        """Return a user's converted files joined with their conversion relations.
+
+        Each record is the converted file's metadata plus an
+        ``original_file`` dict built from the denormalized relation row, so
+        history survives deletion of the original upload. Records follow
+        relation insertion order. The relations table is owned by
+        ConversionRelationsDB and must already exist.
+
+        Args:
+            user_id: UUID of the user whose conversions should be listed.
+
+        Returns:
+            A list of conversion record dictionaries.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(
+            f"SELECT c.*, "  # nosec B608
+            f"r.original_file_id AS rel_original_file_id, "
+            f"r.original_filename AS rel_original_filename, "
+            f"r.original_media_type AS rel_original_media_type, "
+            f"r.original_extension AS rel_original_extension, "
+            f"r.original_size_bytes AS rel_original_size_bytes "
+            f"FROM {self.TABLE_NAME} c "
+            f"INNER JOIN {self._relations_table_name} r ON r.converted_file_id = c.id "
+            f"WHERE r.user_id = ? AND c.user_id = ? "
+            f"ORDER BY r.rowid",
+            (user_id, user_id),
+        )
+        records = []
+        for row in cursor.fetchall():
+            record = dict(row)
+            original_file = {
+                'id': record.pop('rel_original_file_id'),
+                'original_filename': record.pop('rel_original_filename'),
+                'media_type': record.pop('rel_original_media_type'),
+                'extension': record.pop('rel_original_extension'),
+                'size_bytes': record.pop('rel_original_size_bytes'),
+            }
+            record = self._refresh_pdf_media_type(record)
+            record['original_file'] = original_file
+            records.append(record)
+        return records
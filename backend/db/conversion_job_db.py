@@ -3,7 +3,7 @@ import threading
 import uuid
 from typing import Optional
 
-from core import get_settings, validate_sql_identifier, migrate_table_columns
+from core import get_settings, validate_sql_identifier, migrate_table_columns, get_sqlite_connection, release_sqlite_connection
 
 '''
 Anywhere you see # nosec B608, it is marking a Bandit false positive. The table
@@ -55,7 +55,7 @@ class ConversionJobDB:
     @property
     def conn(self) -> sqlite3.Connection:
         if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(self.DB_PATH)
+            self._local.conn = get_sqlite_connection(self.DB_PATH)
         return self._local.conn
 
     def create_tables(self) -> None:
@@ -227,12 +227,10 @@ class ConversionJobDB:
             params.append(status)
         where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
 
-        cursor = self.conn.cursor()
-        cursor.execute(
+        row = self.conn.execute(
             f"SELECT COUNT(*) FROM {self.TABLE_NAME} {where_sql}",  # nosec B608
             tuple(params),
-        )
-        row = cursor.fetchone()
+        ).fetchone()
         return int(row[0]) if row is not None else 0
 
     # ── status transitions ──────────────────────────────────────────
@@ -397,5 +395,5 @@ class ConversionJobDB:
 
     def close(self) -> None:
         if hasattr(self._local, 'conn') and self._local.conn:
-            self._local.conn.close()
+            release_sqlite_connection(self.DB_PATH, self._local.conn)
             self._local.conn = None
@@ -1,6 +1,6 @@
 import sqlite3
 import threading
-from core import get_settings, validate_sql_identifier, migrate_table_columns, assign_orphaned_rows_to_admin
+from core import get_settings, validate_sql_identifier, migrate_table_columns, assign_orphaned_rows_to_admin, get_sqlite_connection, release_sqlite_connection
 
 '''
 Anywhere you see # nosec B608, it is marking a Bandit false positive. The table 
@@ -42,7 +42,7 @@ class DefaultFormatsDB:
     def conn(self) -> sqlite3.Connection:
         """Return a thread-local SQLite connection, creating one if needed."""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(self.DB_PATH)
+            self._local.conn = get_sqlite_connection(self.DB_PATH)
         return self._local.conn
 
     def create_tables(self) -> None:
@@ -152,7 +152,7 @@ class DefaultFormatsDB:
         return cursor.rowcount
 
     def close(self) -> None:
-        """Close the current thread's database connection."""
+        """Release the current thread's database connection."""
         if hasattr(self._local, 'conn') and self._local.conn:
-            self._local.conn.close()
+            release_sqlite_connection(self.DB_PATH, self._local.conn)
             self._local.conn = None
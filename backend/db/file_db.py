@@ -1,8 +1,9 @@
 import sqlite3
 import threading
-from typing import Optional
+from operator import itemgetter
+from typing import Iterable, Iterator, Optional
 from pathlib import Path
-from core import get_settings, validate_sql_identifier, migrate_table_columns, assign_orphaned_rows_to_admin
+from core import get_settings, validate_sql_identifier, migrate_table_columns, assign_orphaned_rows_to_admin, get_sqlite_connection, release_sqlite_connection, SQLITE_HAS_RETURNING
 
 '''
 Anywhere you see # nosec B608, it is marking a Bandit false positive. The table 
@@ -27,6 +28,20 @@ class FileDB:
     settings = get_settings()
     DB_PATH = settings.db_path
     _TABLE_NAME = settings.file_table_name
+    # Keys insert_file_metadata requires, built once rather than per insert
+    _REQUIRED_FIELDS = (
+        'id',
+        'storage_path',
+        'original_filename',
+        'media_type',
+        'extension',
+        'size_bytes',
+        'sha256_checksum',
+        'user_id',
+    )
+    _REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+    # Pulls the insert values out of a metadata dict, in column order
+    _REQUIRED_FIELD_VALUES = itemgetter(*_REQUIRED_FIELDS)
 
     @property
     def TABLE_NAME(self) -> str:
@@ -44,7 +59,7 @@ class FileDB:
     def conn(self) -> sqlite3.Connection:
         """Return a thread-local SQLite connection, creating one if needed."""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(self.DB_PATH)
+            self._local.conn = get_sqlite_connection(self.DB_PATH)
         return self._local.conn
 
     def _create_base_tables(self) -> None:
@@ -98,29 +113,33 @@ class FileDB:
         Raises:
             ValueError: If the metadata dictionary contains missing or extra fields.
         """
-        required_fields = [
-            'id', 
-            'storage_path',
-            'original_filename',
-            'media_type',
-            'extension',
-            'size_bytes',
-            'sha256_checksum',
-            'user_id'
-        ]
-        if metadata.keys() != set(required_fields):
-            raise ValueError(f"Metadata must contain the following fields: {required_fields}. Missing or extra fields: {set(required_fields).symmetric_difference(metadata.keys())}")
+        self.insert_many_file_metadata([metadata])
+
+    def insert_many_file_metadata(self, metadatas: list[dict]) -> None:
+        """Insert several file metadata records in a single transaction.
+
+        Every record is validated before anything is written, so either all
+        rows are inserted or none are. Committing once also avoids paying a
+        WAL commit per row when a single upload yields several files.
+
+        Args:
+            metadatas: File metadata dictionaries, each with the keys
+                required by insert_file_metadata.
+
+        Raises:
+            ValueError: If any metadata dictionary contains missing or extra fields.
+        """
+        rows = [self._metadata_row(metadata) for metadata in metadatas]
+        if not rows:
+            return
         with self.conn:
-            self.conn.execute(f"INSERT INTO {self.TABLE_NAME} (id, storage_path, original_filename, media_type, extension, size_bytes, sha256_checksum, user_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (  # nosec B608
-                metadata['id'],
-                metadata['storage_path'],
-                metadata['original_filename'],
-                metadata['media_type'],
-                metadata['extension'],
-                metadata['size_bytes'],
-                metadata['sha256_checksum'],
-                metadata['user_id'],
-            ))  # nosec B608
+            self.conn.executemany(f"INSERT INTO {self.TABLE_NAME} (id, storage_path, original_filename, media_type, extension, size_bytes, sha256_checksum, user_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)  # nosec B608
+
+    def _metadata_row(self, metadata: dict) -> tuple:
+        """Validate a metadata dict and return its values in column order."""
+        if metadata.keys() != self._REQUIRED_FIELD_SET:
+            raise ValueError(f"Metadata must contain the following fields: {list(self._REQUIRED_FIELDS)}. Missing or extra fields: {metadata.keys() ^ self._REQUIRED_FIELD_SET}")
+        return self._REQUIRED_FIELD_VALUES(metadata)
 
     def _refresh_pdf_media_type(self, metadata: dict) -> dict:
         """Re-detect persisted PDF media types so stale subtype rows self-heal."""
@@ -175,14 +194,22 @@ class FileDB:
 
     def list_files(self, user_id: str | None = None) -> list[dict]:
         """Retrieve metadata for files, optionally filtered by user."""
+        return list(self.iter_files(user_id))
+
+    def iter_files(self, user_id: str | None = None) -> Iterator[dict]:
+        """Yield file metadata one row at a time, optionally filtered by user.
+
+        Rows are fetched lazily from an open statement, so consume the
+        iterator fully on the thread that created it.
+        """
         cursor = self.conn.cursor()
         cursor.row_factory = sqlite3.Row
         if user_id is not None:
             cursor.execute(f"SELECT * FROM {self.TABLE_NAME} WHERE user_id = ?", (user_id,))  # nosec B608
         else:
             cursor.execute(f"SELECT * FROM {self.TABLE_NAME}")  # nosec B608
-        rows = cursor.fetchall()
-        return [self._refresh_pdf_media_type(dict(row)) for row in rows]
+        for row in cursor:
+            yield self._refresh_pdf_media_type(dict(row))
 
     def delete_file_metadata(self, file_id: str) -> None:
         """Delete the metadata record for a specific file.
@@ -194,8 +221,72 @@ class FileDB:
         with self.conn:
             self.conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE id = ?", (file_id,))  # nosec B608
 
+    def delete_files_metadata_by_user(self, user_id: str) -> list[str]:
+        """Delete every metadata record owned by a user in a single statement.
+
+        Args:
+            user_id: The unique identifier of the owning user.
+
+        Returns:
+            The storage paths of the deleted records, so the caller can
+            remove the files from disk.
+        """
+        if SQLITE_HAS_RETURNING:
+            with self.conn:
+                rows = self.conn.execute(
+                    f"DELETE FROM {self.TABLE_NAME} WHERE user_id = ? RETURNING storage_path",  # nosec B608
+                    (user_id,),
+                ).fetchall()
+            return [row[0] for row in rows]
+        rows = self.conn.execute(
+            f"SELECT id, storage_path FROM {self.TABLE_NAME} WHERE user_id = ?",  # nosec B608
+            (user_id,),
+        ).fetchall()
+        self._delete_rows_by_id(row[0] for row in rows)
+        return [row[1] for row in rows]
+
+    def delete_expired_files_metadata(self, cutoff_epoch: float) -> list[tuple[str, str]]:
+        """Delete every record created before a cutoff time in one statement.
+
+        The comparison runs in SQLite, so only expired rows are touched.
+        Rows without a created_at timestamp are never considered expired.
+
+        Args:
+            cutoff_epoch: Unix timestamp; files created strictly before it
+                are deleted.
+
+        Returns:
+            (id, storage_path) pairs of the deleted records, so the caller
+            can remove the files from disk and clean up relations.
+        """
+        if SQLITE_HAS_RETURNING:
+            with self.conn:
+                rows = self.conn.execute(
+                    f"DELETE FROM {self.TABLE_NAME} WHERE created_at < datetime(?, 'unixepoch') RETURNING id, storage_path",  # nosec B608
+                    (int(cutoff_epoch),),
+                ).fetchall()
+            return [(row[0], row[1]) for row in rows]
+        rows = self.conn.execute(
+            f"SELECT id, storage_path FROM {self.TABLE_NAME} WHERE created_at < datetime(?, 'unixepoch')",  # nosec B608
+            (int(cutoff_epoch),),
+        ).fetchall()
+        self._delete_rows_by_id(row[0] for row in rows)
+        return [(row[0], row[1]) for row in rows]
+
+    def _delete_rows_by_id(self, file_ids: Iterable[str]) -> None:
+        """Delete exactly the given records, for SQLite builds without RETURNING.
+
+        Deleting by id rather than re-running the filter keeps rows that
+        match it but were inserted after the caller read its result.
+        """
+        with self.conn:
+            self.conn.executemany(
+                f"DELETE FROM {self.TABLE_NAME} WHERE id = ?",  # nosec B608
+                ((file_id,) for file_id in file_ids),
+            )
+
     def close(self) -> None:
-        """Close the current thread's database connection."""
+        """Release the current thread's database connection."""
         if hasattr(self._local, 'conn') and self._local.conn:
-            self._local.conn.close()
+            release_sqlite_connection(self.DB_PATH, self._local.conn)
             self._local.conn = None
@@ -3,7 +3,9 @@ import sqlite3
 import threading
 from datetime import datetime, timezone
 from enum import Enum
-from core import get_settings, validate_sql_identifier, migrate_table_columns, assign_orphaned_rows_to_admin
+from functools import lru_cache
+from typing import Any, Callable
+from core import get_settings, validate_sql_identifier, migrate_table_columns, assign_orphaned_rows_to_admin, get_sqlite_connection, release_sqlite_connection, SQLITE_HAS_RETURNING
 
 '''
 Anywhere you see # nosec B608, it is marking a Bandit false positive. The table 
@@ -116,6 +118,34 @@ def normalize_datetime_display_format(value: str) -> str:
     return normalized
 
 
+def _bool_to_int(value: object) -> int:
+    """Store booleans as SQLite integers."""
+    return int(bool(value))
+
+
+# Converts each updatable column's API value to its stored form. The theme
+# is validated against the custom themes table in update_settings itself.
+_SETTINGS_COLUMN_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "theme":                   str,
+    "auto_download":           _bool_to_int,
+    "keep_originals":          _bool_to_int,
+    "cleanup_enabled":         _bool_to_int,
+    "cleanup_ttl_minutes":     int,
+    "datetime_display_format": normalize_datetime_display_format,
+}
+
+# Columns update_settings may write, in the order they appear in SET clauses
+_UPDATABLE_SETTINGS_COLUMNS: tuple[str, ...] = tuple(_SETTINGS_COLUMN_COERCERS)
+# Every user-facing settings column, as read back by _row_to_dict
+_SETTINGS_SELECT_COLUMNS = ", ".join(_UPDATABLE_SETTINGS_COLUMNS)
+
+
+@lru_cache(maxsize=64)
+def _settings_set_clause(columns: tuple[str, ...]) -> str:
+    """Build, once per column combination, the SET clause for update_settings."""
+    return ", ".join(f"{col} = ?" for col in columns)
+
+
 # Defaults applied when a user has no settings row yet
 _DEFAULT_SETTINGS = {
     "theme":            Theme.RUBEDO.value,
@@ -127,6 +157,50 @@ _DEFAULT_SETTINGS = {
 }
 
 
+class _SettingsCache:
+    """Process-wide cache of typed settings rows, shared by every SettingsDB.
+
+    The API, the queue workers and the cleanup task each hold their own
+    SettingsDB, so the cache lives outside any one instance. A write through
+    any SettingsDB invalidates the cache. The generation counter keeps a read
+    that raced with a write from storing the row it read before the write.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rows: dict[tuple[str, str, str], dict] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """int: Incremented on every invalidation."""
+        return self._generation
+
+    def get(self, key: tuple[str, str, str]) -> dict | None:
+        """Return a copy of the cached settings for key, or None on a miss."""
+        with self._lock:
+            cached = self._rows.get(key)
+        return dict(cached) if cached is not None else None
+
+    def put(self, key: tuple[str, str, str], value: dict, generation: int) -> None:
+        """Cache value unless the cache was invalidated since generation was read."""
+        with self._lock:
+            if generation == self._generation:
+                self._rows[key] = dict(value)
+
+    def invalidate(self, key: tuple[str, str, str] | None = None) -> None:
+        """Drop one cached entry, or every entry when key is None."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._rows.clear()
+            else:
+                self._rows.pop(key, None)
+
+
+_settings_cache = _SettingsCache()
+
+
 class SettingsDB:
     """Database class for managing application settings.
 
@@ -172,7 +246,7 @@ class SettingsDB:
     def conn(self) -> sqlite3.Connection:
         """Return a thread-local SQLite connection, creating one if needed."""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(self.DB_PATH)
+            self._local.conn = get_sqlite_connection(self.DB_PATH)
         return self._local.conn
 
     def create_tables(self) -> None:
@@ -204,6 +278,7 @@ class SettingsDB:
 
         # Assign pre-auth orphaned rows to the first admin
         assign_orphaned_rows_to_admin(self.conn, self.TABLE_NAME)
+        _settings_cache.invalidate()
 
         # Custom themes table (admin-managed, shared across all users).
         # NOTE: several token names (`primary`, `text`, `accent`) collide with
@@ -227,26 +302,22 @@ class SettingsDB:
 
     def _ensure_user_row(self, user_id: str) -> None:
         """Insert the default settings row for a user if it does not already exist."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            f"SELECT id FROM {self.TABLE_NAME} WHERE user_id = ?",  # nosec B608
-            (user_id,)
-        )
-        if cursor.fetchone() is None:
-            with self.conn:
-                self.conn.execute(
-                    f"INSERT INTO {self.TABLE_NAME} (user_id, theme, auto_download, keep_originals, cleanup_enabled, cleanup_ttl_minutes, datetime_display_format) "  # nosec B608
-                    f"VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        user_id,
-                        _DEFAULT_SETTINGS["theme"],
-                        int(_DEFAULT_SETTINGS["auto_download"]),
-                        int(_DEFAULT_SETTINGS["keep_originals"]),
-                        int(_DEFAULT_SETTINGS["cleanup_enabled"]),
-                        int(_DEFAULT_SETTINGS["cleanup_ttl_minutes"]),
-                        _DEFAULT_SETTINGS["datetime_display_format"],
-                    )
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO {self.TABLE_NAME} (user_id, theme, auto_download, keep_originals, cleanup_enabled, cleanup_ttl_minutes, datetime_display_format) "  # nosec B608
+                f"SELECT ?, ?, ?, ?, ?, ?, ? "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {self.TABLE_NAME} WHERE user_id = ?)",
+                (
+                    user_id,
+                    _DEFAULT_SETTINGS["theme"],
+                    int(_DEFAULT_SETTINGS["auto_download"]),
+                    int(_DEFAULT_SETTINGS["keep_originals"]),
+                    int(_DEFAULT_SETTINGS["cleanup_enabled"]),
+                    int(_DEFAULT_SETTINGS["cleanup_ttl_minutes"]),
+                    _DEFAULT_SETTINGS["datetime_display_format"],
+                    user_id,
                 )
+            )
 
     @staticmethod
     def _row_to_dict(row: dict) -> dict:
@@ -272,28 +343,64 @@ class SettingsDB:
 
     def get_settings(self, user_id: str) -> dict:
         """Return the settings for a given user, creating defaults if needed."""
-        self._ensure_user_row(user_id)
+        cache_key = self._cache_key(user_id)
+        if cache_key is not None:
+            cached = _settings_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        generation = _settings_cache.generation
+
+        row = self._fetch_user_row(user_id)
+        if row is None:
+            # Only a user's first read pays for the insert.
+            self._ensure_user_row(user_id)
+            row = self._fetch_user_row(user_id)
+        if row is None:
+            return dict(_DEFAULT_SETTINGS)
+        result = self._row_to_dict(row)
+        if cache_key is not None:
+            _settings_cache.put(cache_key, result, generation)
+        return result
+
+    def _cache_key(self, user_id: str) -> tuple[str, str, str] | None:
+        """Return the settings cache key for a user, or None if uncacheable.
+
+        Every ``:memory:`` connection is its own database, so rows read from
+        one must never be served to another.
+        """
+        db_path = str(self.DB_PATH)
+        if db_path == ":memory:":
+            return None
+        return (db_path, self.TABLE_NAME, user_id)
+
+    def _invalidate_cached_settings(self, user_id: str) -> None:
+        """Drop a user's cached settings after writing to their row."""
+        cache_key = self._cache_key(user_id)
+        if cache_key is not None:
+            _settings_cache.invalidate(cache_key)
+
+    def _fetch_user_row(self, user_id: str) -> sqlite3.Row | None:
+        """Return the raw settings row for a user, or None if there is none."""
         cursor = self.conn.cursor()
         cursor.row_factory = sqlite3.Row
         cursor.execute(
-            f"SELECT * FROM {self.TABLE_NAME} WHERE user_id = ?",  # nosec B608
+            f"SELECT {_SETTINGS_SELECT_COLUMNS} FROM {self.TABLE_NAME} WHERE user_id = ?",  # nosec B608
             (user_id,)
         )
-        row = cursor.fetchone()
-        if row is None:
-            return dict(_DEFAULT_SETTINGS)
-        return self._row_to_dict(row)
+        return cursor.fetchone()
 
     def update_settings(self, user_id: str, updates: dict) -> dict:
         """Apply a partial or full update to a user's settings."""
-        self._ensure_user_row(user_id)
-        # Prevent SQL injection by allowing only known columns
-        allowed = {"theme", "auto_download", "keep_originals", "cleanup_enabled", "cleanup_ttl_minutes", "datetime_display_format"}
-        filtered = {k: v for k, v in updates.items() if k in allowed}
+        # Prevent SQL injection by allowing only known columns. Walking the
+        # column tuple also gives every update a canonical column order.
+        filtered = {col: updates[col] for col in _UPDATABLE_SETTINGS_COLUMNS if col in updates}
 
         if not filtered:
+            # Nothing to write; usually served from the settings cache.
             return self.get_settings(user_id)
 
+        self._ensure_user_row(user_id)
+
         # Validate theme value against built-ins and the custom themes table.
         # Custom themes are admin-managed but every user may *select* them.
         if "theme" in filtered:
@@ -306,29 +413,33 @@ class SettingsDB:
                     f"Invalid theme '{theme_value}'. Must be a built-in "
                     f"({valid_builtins}) or an existing custom theme key."
                 )
-            filtered["theme"] = theme_value
-
-        if "auto_download" in filtered:
-            filtered["auto_download"] = int(bool(filtered["auto_download"]))
-        if "keep_originals" in filtered:
-            filtered["keep_originals"] = int(bool(filtered["keep_originals"]))
-        if "cleanup_enabled" in filtered:
-            filtered["cleanup_enabled"] = int(bool(filtered["cleanup_enabled"]))
-        if "cleanup_ttl_minutes" in filtered:
-            filtered["cleanup_ttl_minutes"] = int(filtered["cleanup_ttl_minutes"])
-        if "datetime_display_format" in filtered:
-            filtered["datetime_display_format"] = normalize_datetime_display_format(filtered["datetime_display_format"])
-
-        set_clause = ", ".join(f"{col} = ?" for col in filtered)
+
+        filtered = {col: _SETTINGS_COLUMN_COERCERS[col](value) for col, value in filtered.items()}
+
+        set_clause = _settings_set_clause(tuple(filtered))
         values = list(filtered.values()) + [user_id]
 
+        rows = []
         with self.conn:
-            self.conn.execute(
-                f"UPDATE {self.TABLE_NAME} SET {set_clause} WHERE user_id = ?",  # nosec B608
-                values
-            )
+            cursor = self.conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            if SQLITE_HAS_RETURNING:
+                # Read the updated row back in the same statement.
+                cursor.execute(
+                    f"UPDATE {self.TABLE_NAME} SET {set_clause} WHERE user_id = ? RETURNING {_SETTINGS_SELECT_COLUMNS}",  # nosec B608
+                    values
+                )
+                rows = cursor.fetchall()
+            else:
+                cursor.execute(
+                    f"UPDATE {self.TABLE_NAME} SET {set_clause} WHERE user_id = ?",  # nosec B608
+                    values
+                )
+        self._invalidate_cached_settings(user_id)
 
-        return self.get_settings(user_id)
+        if not rows:
+            return self.get_settings(user_id)
+        return self._row_to_dict(rows[0])
 
     def get_admin_cleanup_settings(self) -> dict:
         """Return cleanup settings from the first admin user's row.
@@ -369,6 +480,7 @@ class SettingsDB:
                 f"DELETE FROM {self.TABLE_NAME} WHERE user_id = ?",  # nosec B608
                 (user_id,)
             )
+        self._invalidate_cached_settings(user_id)
         return cursor.rowcount > 0
 
     # ===== Custom theme management =====
@@ -580,10 +692,12 @@ class SettingsDB:
                 f"DELETE FROM {self.CUSTOM_THEMES_TABLE_NAME} WHERE key = ?",  # nosec B608
                 (key,),
             )
+        # Any number of users may have been reset to the fallback theme.
+        _settings_cache.invalidate()
         return cursor.rowcount > 0
 
     def close(self) -> None:
-        """Close the current thread's database connection."""
+        """Release the current thread's database connection."""
         if hasattr(self._local, 'conn') and self._local.conn:
-            self._local.conn.close()
+            release_sqlite_connection(self.DB_PATH, self._local.conn)
             self._local.conn = None
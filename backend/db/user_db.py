@@ -3,7 +3,7 @@ import threading
 from enum import Enum
 from typing import Optional
 
-from core import get_settings, migrate_table_columns, validate_sql_identifier
+from core import get_settings, migrate_table_columns, validate_sql_identifier, get_sqlite_connection, release_sqlite_connection
 
 '''
 Anywhere you see # nosec B608, it is marking a Bandit false positive. The table
@@ -52,7 +52,7 @@ class UserDB:
     def conn(self) -> sqlite3.Connection:
         """Return a thread-local SQLite connection, creating one if needed."""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(self.DB_PATH)
+            self._local.conn = get_sqlite_connection(self.DB_PATH)
         return self._local.conn
 
     @staticmethod
@@ -223,14 +223,13 @@ class UserDB:
 
     def username_exists(self, username: str, exclude_uuid: str | None = None) -> bool:
         """Return whether a username is already used by another account."""
-        cursor = self.conn.cursor()
         if exclude_uuid is None:
-            cursor.execute(
+            cursor = self.conn.execute(
                 f"SELECT 1 FROM {self.TABLE_NAME} WHERE username = ? LIMIT 1",  # nosec B608
                 (username,)
             )
         else:
-            cursor.execute(
+            cursor = self.conn.execute(
                 f"SELECT 1 FROM {self.TABLE_NAME} WHERE username = ? AND uuid != ? LIMIT 1",  # nosec B608
                 (username, exclude_uuid)
             )
@@ -238,9 +237,7 @@ class UserDB:
 
     def count_users(self) -> int:
         """Return the total number of users in the database."""
-        cursor = self.conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {self.TABLE_NAME}")  # nosec B608
-        row = cursor.fetchone()
+        row = self.conn.execute(f"SELECT COUNT(*) FROM {self.TABLE_NAME}").fetchone()  # nosec B608
         return int(row[0]) if row is not None else 0
 
     def has_users(self) -> bool:
@@ -297,9 +294,7 @@ class UserDB:
 
     def count_non_guest_users(self) -> int:
         """Return the total number of non-guest users in the database."""
-        cursor = self.conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {self.TABLE_NAME} WHERE is_guest = 0")  # nosec B608
-        row = cursor.fetchone()
+        row = self.conn.execute(f"SELECT COUNT(*) FROM {self.TABLE_NAME} WHERE is_guest = 0").fetchone()  # nosec B608
         return int(row[0]) if row is not None else 0
 
     def has_non_guest_users(self) -> bool:
@@ -316,7 +311,7 @@ class UserDB:
         return [self._row_to_dict(row) for row in cursor.fetchall()]
 
     def close(self) -> None:
-        """Close the current thread's database connection."""
+        """Release the current thread's database connection."""
         if hasattr(self._local, 'conn') and self._local.conn:
-            self._local.conn.close()
+            release_sqlite_connection(self.DB_PATH, self._local.conn)
             self._local.conn = None
@@ -2,7 +2,7 @@ import sqlite3
 import threading
 from typing import Optional
 
-from core import get_settings, validate_sql_identifier, migrate_table_columns
+from core import get_settings, validate_sql_identifier, migrate_table_columns, get_sqlite_connection
 
 '''
 Anywhere you see # nosec B608, it is marking a Bandit false positive. The table
@@ -43,7 +43,7 @@ class UserIdentityDB:
     def conn(self) -> sqlite3.Connection:
         """Return a thread-local SQLite connection, creating one if needed."""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(self.DB_PATH)
+            self._local.conn = get_sqlite_connection(self.DB_PATH)
         return self._local.conn
 
     def create_tables(self) -> None:
@@ -1,4 +1,3 @@
-import hashlib
 import logging
 import os
 import re
@@ -11,6 +10,7 @@ from urllib.parse import urlparse
 import yt_dlp
 from yt_dlp.extractor import gen_extractors
 
+from core import compute_sha256_checksum
 from .downloader_interface import DownloaderInterface, DownloadResult, DownloadError
 
 logger = logging.getLogger(__name__)
@@ -132,11 +132,6 @@ class YtDlpDownloader(DownloaderInterface):
                 final_path.unlink(missing_ok=True)
                 continue
 
-            sha256 = hashlib.sha256()
-            with final_path.open("rb") as f:
-                for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                    sha256.update(chunk)
-
             title = entry.get("title") or "video"
             original_filename = _safe_original_filename(title, ext)
 
@@ -145,7 +140,7 @@ class YtDlpDownloader(DownloaderInterface):
                 file_path=final_path,
                 original_filename=original_filename,
                 size_bytes=size_bytes,
-                sha256_checksum=sha256.hexdigest(),
+                sha256_checksum=compute_sha256_checksum(final_path),
             ))
 
         shutil.rmtree(staging_dir, ignore_errors=True)
@@ -3,10 +3,11 @@ import logging
 import re
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.openapi.utils import get_openapi
 from textwrap import dedent
 from api import router
+from api.deps import warm_db_dependencies
 from api.routes.oidc import attach_session_middleware
 from core import build_logging_config, configure_logging, get_settings
 from background import (
@@ -69,6 +70,9 @@ def create_app() -> FastAPI:
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
+        # Create the shared DB handles (and their tables) before serving, so
+        # the async dependencies that hand them out never block the loop.
+        warm_db_dependencies()
         # Mark any jobs that were `running` when the previous process died
         # as stale so they can be retried from scratch.
         recover_running_jobs()
@@ -92,6 +96,8 @@ def create_app() -> FastAPI:
         servers=[{"url": settings.api_server_url, "description": f"{settings.app_name} API server"}],
         docs_url=None,
         redoc_url=None,
+        # Served below from a cached serialization instead.
+        openapi_url=None,
         redirect_slashes=True,
         # Fixes OpenAPI/docs/url_for URLs under a reverse-proxy sub-path ("" = root).
         root_path=settings.root_path,
@@ -131,6 +137,18 @@ def create_app() -> FastAPI:
 
     app.openapi = custom_openapi
 
+    # FastAPI's built-in /openapi.json route re-serializes the whole schema
+    # on every request. The schema is fixed once built, so encode it once.
+    openapi_body: bytes | None = None
+
+    async def openapi_json(request: Request) -> Response:
+        nonlocal openapi_body
+        if openapi_body is None:
+            openapi_body = JSONResponse(app.openapi()).body
+        return Response(openapi_body, media_type="application/json")
+
+    app.add_route("/openapi.json", openapi_json, include_in_schema=False)
+
     # Session middleware is needed for the OIDC authorization round-trip
     attach_session_middleware(app)
 
@@ -148,11 +166,21 @@ def create_app() -> FastAPI:
             else None
         )
 
+        # The built frontend is fixed while the server runs, so index its
+        # files once rather than resolving the requested path on every
+        # request. Anything resolving outside web_dir is left out.
+        web_root = web_dir.resolve()
+        web_files = {
+            file_path.relative_to(web_dir).as_posix(): file_path
+            for file_path in web_dir.rglob("*")
+            if file_path.is_file() and file_path.resolve().is_relative_to(web_root)
+        }
+
         # Catch-all route for SPA - serves index.html for non-API routes
         @app.get("/{path:path}", include_in_schema=False)
         async def spa_fallback(request: Request, path: str):
-            requested_file = (web_dir / path).resolve()
-            if requested_file.is_file() and requested_file.is_relative_to(web_dir.resolve()):
+            requested_file = web_files.get(path)
+            if requested_file is not None:
                 return FileResponse(requested_file)
 
             if index_html is not None:
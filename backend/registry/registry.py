@@ -52,6 +52,8 @@ class ConverterRegistry:
         self.converters = {}
         self.input_format_map = {}  # Maps input format -> list of converter classes
         self.output_format_map = {}  # Maps output format -> list of converter classes
+        self._compatible_formats_cache = {}  # Maps format type -> compatible formats and qualities
+        self._conversion_converter_cache = {}  # Maps (input, output) format -> converter class
         self._auto_register(skip_unregisterable)
     
     def _auto_register(self, skip_unregisterable: bool) -> None:
@@ -76,6 +78,9 @@ class ConverterRegistry:
             converter_class: The converter class to register
         """
         self.converters[converter_class.__name__] = converter_class
+        # Any cached compatibility lookups may now be stale.
+        self._compatible_formats_cache = {}
+        self._conversion_converter_cache = {}
         
         # Map supported formats to this converter
         if hasattr(converter_class, 'supported_input_formats'):
@@ -179,6 +184,20 @@ class ConverterRegistry:
         Returns:
             Converter class that supports both formats, or None
         """
+        cache_key = (input_format, output_format)
+        cached = self._conversion_converter_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        converter = self._find_converter_for_conversion(input_format, output_format)
+        # As with compatible formats, only successful lookups are cached so
+        # unsupported format strings cannot grow the cache.
+        if converter is not None:
+            self._conversion_converter_cache[cache_key] = converter
+        return converter
+
+    def _find_converter_for_conversion(self, input_format, output_format) -> Type[ConverterInterface] | None:
+        """Resolve the converter for a conversion without consulting the cache."""
         normalized_input = self.get_normalized_format(input_format)
         normalized_output = self.get_normalized_format(output_format)
         input_converters = set(self.get_converters_for_input_format(normalized_input))
@@ -239,13 +258,17 @@ class ConverterRegistry:
                 result[name] = []
         return result
     
-    def get_compatible_formats_and_qualities(self, format_type) -> dict[str, set[str]]:
+    def get_compatible_formats_and_qualities(self, format_type) -> dict[str, frozenset[str]]:
         """
         Get all formats compatible with the given format.
         
         A format is considered compatible if there exists a converter that
         supports both the given format and the compatible format, AND the
         conversion is actually valid in that direction.
+
+        Results are memoized per format type (file listings ask for the
+        same handful of media types on every row), so the returned mapping
+        is shared and must not be mutated.
         
         Args:
             format_type: File format (e.g., 'jpg', 'mp4', 'csv')
@@ -253,6 +276,20 @@ class ConverterRegistry:
         Returns:
             Dictionary mapping compatible format strings to their available quality options
         """
+        cached = self._compatible_formats_cache.get(format_type)
+        if cached is not None:
+            return cached
+
+        compatible = self._build_compatible_formats_and_qualities(format_type)
+        # Only cache supported formats: unsupported ones are cheap to
+        # resolve, and caching them would let arbitrary upload extensions
+        # grow the cache without bound.
+        if compatible:
+            self._compatible_formats_cache[format_type] = compatible
+        return compatible
+
+    def _build_compatible_formats_and_qualities(self, format_type) -> dict[str, frozenset[str]]:
+        """Compute the uncached result for get_compatible_formats_and_qualities."""
         normalized_format = self.get_normalized_format(format_type)
         alias_base_format = WEB_ALIAS_BASE_FORMATS.get(normalized_format)
         compatibility_input_format = alias_base_format if alias_base_format else format_type
@@ -281,7 +318,7 @@ class ConverterRegistry:
                 compatible.setdefault(alias_base_format, set())
                 if alias_base_format in converter_class.get_formats_with_quality_options():
                     compatible[alias_base_format].update(converter_class.get_quality_options())
-        return compatible
+        return {fmt: frozenset(qualities) for fmt, qualities in compatible.items()}
     
     def get_format_compatibility_matrix(self) -> dict[str, set[str]]:
         """
@@ -20,7 +20,7 @@ import uuid
 
 from compressors import CompressorInterface
 from core import (
-    compute_sha256_checksum,
+    compute_sha256_checksum_and_size,
     delete_file_and_metadata,
     get_settings,
     media_type_aliases,
@@ -128,7 +128,7 @@ def run_compression_job(
 
     moved_output_file = _move_output_file(
         Path(output_files[0]),
-        Path(f"{compressed_dir}/{compressed_id}{output_extension}"),
+        compressed_dir / f"{compressed_id}{output_extension}",
     )
 
     compressed_metadata = dict(source_metadata)
@@ -136,8 +136,9 @@ def run_compression_job(
     compressed_metadata["media_type"] = media_format
     compressed_metadata["extension"] = output_extension
     compressed_metadata["storage_path"] = str(moved_output_file)
-    compressed_metadata["size_bytes"] = moved_output_file.stat().st_size
-    compressed_metadata["sha256_checksum"] = compute_sha256_checksum(moved_output_file)
+    checksum, size_bytes = compute_sha256_checksum_and_size(moved_output_file)
+    compressed_metadata["size_bytes"] = size_bytes
+    compressed_metadata["sha256_checksum"] = checksum
     compressed_metadata["user_id"] = user_id
     compressed_metadata.pop("created_at", None)
     if compression_level:
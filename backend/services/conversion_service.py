@@ -20,7 +20,7 @@ from zipfile import ZIP_DEFLATED, ZipFile
 
 from converters import ConverterInterface
 from core import (
-    compute_sha256_checksum,
+    compute_sha256_checksum_and_size,
     delete_file_and_metadata,
     get_settings,
     media_type_extensions,
@@ -117,7 +117,7 @@ def run_conversion_job(
 
     input_format = source_metadata["media_type"]
     output_extension = f".{media_type_extensions.get(output_format, output_format)}"
-    converted_id = str(uuid.uuid4())
+    converted_id = uuid.uuid4().hex
 
     # Resolve default quality lazily so the user's current setting wins.
     if quality is None and default_qualities_db is not None:
@@ -136,7 +136,7 @@ def run_conversion_job(
         passthrough_base = WEB_ALIAS_PASSTHROUGH.get(input_format)
         if passthrough_base is not None and output_format == passthrough_base:
             output_files = _copy_web_alias_to_base(
-                source_metadata["storage_path"], Path(temp_dir), converted_id, output_format
+                source_metadata["storage_path"], temp_dir, converted_id, output_format
             )
         else:
             output_files = converter.convert(quality=quality)
@@ -149,7 +149,7 @@ def run_conversion_job(
     if len(output_files) == 1:
         moved_output_file = _move_output_file(
             Path(output_files[0]),
-            Path(f"{converted_dir}/{converted_id}{output_extension}"),
+            converted_dir / f"{converted_id}{output_extension}",
         )
         final_media_type = output_format
         final_extension = output_extension
@@ -158,7 +158,7 @@ def run_conversion_job(
         # into a single ZIP so the rest of the pipeline (DB, downloads,
         # history) can keep treating each conversion as one persisted
         # artifact.
-        moved_output_file = Path(f"{converted_dir}/{converted_id}.zip")
+        moved_output_file = converted_dir / f"{converted_id}.zip"
         # Rename entries to use the original uploaded filename's stem
         # instead of the UUID-based temp filename, so the user sees
         # something recognizable inside the archive.
@@ -204,8 +204,9 @@ def run_conversion_job(
     converted_metadata["media_type"] = final_media_type
     converted_metadata["extension"] = final_extension
     converted_metadata["storage_path"] = str(moved_output_file)
-    converted_metadata["size_bytes"] = moved_output_file.stat().st_size
-    converted_metadata["sha256_checksum"] = compute_sha256_checksum(moved_output_file)
+    checksum, size_bytes = compute_sha256_checksum_and_size(moved_output_file)
+    converted_metadata["size_bytes"] = size_bytes
+    converted_metadata["sha256_checksum"] = checksum
     converted_metadata["user_id"] = user_id
     converted_metadata.pop("created_at", None)
     if quality:
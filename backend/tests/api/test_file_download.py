@@ -0,0 +1,19 @@
+from api.routes.files import etag_matches
+
+
+ETAG = '"abc123"'
+
+
+def test_etag_matches_exact_value():
+    assert etag_matches('"abc123"', ETAG)
+
+
+def test_etag_matches_any_entry_in_list():
+    assert etag_matches('"other", W/"abc123"', ETAG)
+    assert etag_matches("*", ETAG)
+
+
+def test_etag_does_not_match_missing_or_different_value():
+    assert not etag_matches(None, ETAG)
+    assert not etag_matches("", ETAG)
+    assert not etag_matches('"other"', ETAG)
@@ -0,0 +1,121 @@
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import yaml
+
+import converters.pandas_convert as pandas_convert
+from converters.pandas_convert import (
+    PandasConverter,
+    _prepare_dataframe_for_arrow,
+    _structured_data_to_dataframe,
+)
+
+
+def _convert(input_file, output_dir, input_type: str, output_type: str) -> str:
+    converter = PandasConverter(
+        input_file=str(input_file),
+        output_dir=str(output_dir),
+        input_type=input_type,
+        output_type=output_type,
+    )
+    [output_file] = converter.convert()
+    return output_file
+
+
+def _write_via_dataframe(df) -> io.BytesIO:
+    """Write df to Parquet the way the DataFrame path in convert() does."""
+    return io.BytesIO(_prepare_dataframe_for_arrow(df).to_parquet(index=False))
+
+
+@pytest.mark.parametrize(
+    ("text", "uses_fast_path"),
+    [
+        pytest.param("name,count,ratio,flag\nx,1,1.5,true\ny,2,,False\n", True, id="fast-path-types"),
+        pytest.param("a,b\nx,1\nNone,2\n,3\n", True, id="pandas-null-tokens"),
+        pytest.param("d,t,n\n2024-01-02,12:30:00,1\n2024-01-03,12:31:00,\n", False, id="date-time-int-with-blank"),
+        pytest.param("a,b\n,1\n,2\n", False, id="all-blank-column"),
+        pytest.param("a\n1\ntrue\n", True, id="numeric-and-bool-tokens"),
+        pytest.param("a\n18446744073709551615\n1\n", False, id="uint64-range"),
+    ],
+)
+def test_csv_to_parquet_matches_dataframe_path(tmp_path, text, uses_fast_path):
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(text)
+
+    output_file = _convert(input_file, tmp_path / "out", "csv", "parquet")
+
+    expected = _write_via_dataframe(pd.read_csv(input_file))
+    actual_schema = pq.read_schema(output_file)
+    assert actual_schema.remove_metadata() == pq.read_schema(expected).remove_metadata()
+    # Only the DataFrame path embeds pandas metadata in the file.
+    assert (b"pandas" not in (actual_schema.metadata or {})) is uses_fast_path
+    pd.testing.assert_frame_equal(pd.read_parquet(output_file), pd.read_parquet(expected))
+
+
+def test_json_records_to_parquet_schema(tmp_path):
+    input_file = tmp_path / "input.json"
+    input_file.write_text(
+        '[{"name": "x", "count": 1, "ratio": 1.5, "flag": true, "note": null},'
+        ' {"name": "y", "count": 2, "ratio": 2, "flag": false, "note": "n"}]'
+    )
+
+    output_file = _convert(input_file, tmp_path / "out", "json", "parquet")
+
+    assert pq.read_schema(output_file).remove_metadata() == pa.schema([
+        ("name", pa.large_string()),
+        ("count", pa.int64()),
+        ("ratio", pa.float64()),
+        ("flag", pa.bool_()),
+        ("note", pa.large_string()),
+    ])
+
+
+@pytest.mark.parametrize(
+    ("text", "uses_fast_path"),
+    [
+        pytest.param("- {name: x, count: 1}\n- {name: null, count: 2}\n", True, id="strings-with-null"),
+        pytest.param("- {count: 1}\n- {count: null}\n", False, id="int-with-null"),
+        pytest.param("- {day: 2024-01-02}\n- {day: 2024-01-03}\n", False, id="dates"),
+        pytest.param("- {value: 1}\n- {value: x}\n", False, id="mixed-types"),
+    ],
+)
+def test_yaml_records_to_parquet_matches_dataframe_path(tmp_path, text, uses_fast_path):
+    input_file = tmp_path / "input.yaml"
+    input_file.write_text(text)
+
+    output_file = _convert(input_file, tmp_path / "out", "yaml", "parquet")
+
+    expected = _write_via_dataframe(_structured_data_to_dataframe(yaml.safe_load(text)))
+    actual_schema = pq.read_schema(output_file)
+    assert actual_schema.remove_metadata() == pq.read_schema(expected).remove_metadata()
+    assert (b"pandas" not in (actual_schema.metadata or {})) is uses_fast_path
+    pd.testing.assert_frame_equal(pd.read_parquet(output_file), pd.read_parquet(expected))
+
+
+def test_csv_to_yaml_slices_form_one_sequence(tmp_path, monkeypatch):
+    monkeypatch.setattr(pandas_convert, "_YAML_RECORDS_CHUNK_ROWS", 2)
+    input_file = tmp_path / "input.csv"
+    input_file.write_text("name,count\n" + "".join(f"row{i},{i}\n" for i in range(5)))
+
+    output_file = _convert(input_file, tmp_path / "out", "csv", "yaml")
+
+    expected = pd.read_csv(input_file).to_dict(orient="records")
+    with open(output_file, encoding="utf-8") as f:
+        text = f.read()
+    assert yaml.safe_load(text) == expected
+    assert text == yaml.dump(expected, default_flow_style=False)
+
+
+@pytest.mark.parametrize("rows", [0, 3])
+def test_jsonl_to_yaml_without_columns_writes_empty_sequence(tmp_path, monkeypatch, rows):
+    monkeypatch.setattr(pandas_convert, "_YAML_RECORDS_CHUNK_ROWS", 2)
+    input_file = tmp_path / "input.jsonl"
+    input_file.write_text("{}\n" * rows)
+
+    output_file = _convert(input_file, tmp_path / "out", "jsonl", "yaml")
+
+    with open(output_file, encoding="utf-8") as f:
+        assert yaml.safe_load(f) == []
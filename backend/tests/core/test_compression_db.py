@@ -1,4 +1,4 @@
-from db import CompressionDB
+from db import CompressionDB, CompressionRelationsDB
 
 
 def test_compression_db_initializes_compression_level_column(monkeypatch):
@@ -12,3 +12,31 @@ def test_compression_db_initializes_compression_level_column(monkeypatch):
         assert 'compression_level' in column_names
     finally:
         db.close()
+
+
+def test_compression_relations_db_indexes_lookup_columns(monkeypatch):
+    monkeypatch.setattr(CompressionRelationsDB, 'DB_PATH', ':memory:')
+
+    db = CompressionRelationsDB()
+    try:
+        indexed_columns = set()
+        for index in db.conn.execute(f"PRAGMA index_list({db.TABLE_NAME})").fetchall():
+            for column in db.conn.execute(f"PRAGMA index_info({index[1]})").fetchall():
+                indexed_columns.add(column[2])
+
+        assert {'original_file_id', 'compressed_file_id', 'user_id'} <= indexed_columns
+
+        db.insert_compression_relation({
+            'original_file_id': 'orig',
+            'compressed_file_id': 'comp',
+            'original_filename': 'photo.jpg',
+            'original_media_type': 'jpeg',
+            'original_extension': '.jpg',
+            'original_size_bytes': 10,
+            'user_id': 'user-1',
+        })
+        assert db.get_compression_from_file('orig') == 'comp'
+        assert db.get_original_from_compression('comp') == 'orig'
+        assert db.get_compression_from_file('missing') is None
+    finally:
+        db.close()
@@ -1,4 +1,6 @@
-from db import ConversionDB
+import pytest
+
+from db import ConversionDB, ConversionRelationsDB
 
 
 def test_conversion_db_initializes_quality_column(monkeypatch):
@@ -11,4 +13,178 @@ def test_conversion_db_initializes_quality_column(monkeypatch):
 
         assert 'quality' in column_names
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def _conversion_metadata(file_id, user_id, **overrides):
+    metadata = {
+        'id': file_id,
+        'storage_path': f'/tmp/{file_id}.png',
+        'original_filename': 'photo.jpg',
+        'media_type': 'png',
+        'extension': '.png',
+        'size_bytes': 10,
+        'sha256_checksum': 'abc',
+        'user_id': user_id,
+    }
+    metadata.update(overrides)
+    return metadata
+
+
+def test_insert_many_file_metadata_is_all_or_nothing(monkeypatch):
+    monkeypatch.setattr(ConversionDB, 'DB_PATH', ':memory:')
+
+    db = ConversionDB()
+    try:
+        db.insert_many_file_metadata([
+            _conversion_metadata('conv-1', 'user-1'),
+            _conversion_metadata('conv-2', 'user-1'),
+        ])
+        with pytest.raises(ValueError):
+            db.insert_many_file_metadata([
+                _conversion_metadata('conv-3', 'user-1'),
+                {'id': 'conv-4'},
+            ])
+
+        ids = {row[0] for row in db.conn.execute(f"SELECT id FROM {db.TABLE_NAME}").fetchall()}
+        assert ids == {'conv-1', 'conv-2'}
+    finally:
+        db.close()
+
+
+def test_list_files_with_relations_joins_original_metadata(monkeypatch, tmp_path):
+    # Both tables must live in one database file for the join.
+    db_path = str(tmp_path / 'conversions.db')
+    monkeypatch.setattr(ConversionDB, 'DB_PATH', db_path)
+    monkeypatch.setattr(ConversionRelationsDB, 'DB_PATH', db_path)
+
+    db = ConversionDB()
+    relations_db = ConversionRelationsDB()
+    try:
+        db.insert_file_metadata(_conversion_metadata('conv-1', 'user-1'))
+        db.insert_file_metadata(_conversion_metadata('conv-2', 'user-2'))
+        db.insert_file_metadata(_conversion_metadata('conv-orphan', 'user-1'))
+        for original_id, converted_id, filename, size_bytes, user_id in [
+            ('orig-1', 'conv-1', 'photo.jpg', 123, 'user-1'),
+            ('orig-2', 'conv-2', 'other.jpg', 456, 'user-2'),
+            ('orig-3', 'conv-missing', 'gone.jpg', 789, 'user-1'),
+        ]:
+            relations_db.insert_conversion_relation({
+                'original_file_id': original_id,
+                'converted_file_id': converted_id,
+                'original_filename': filename,
+                'original_media_type': 'jpeg',
+                'original_extension': 'jpg',
+                'original_size_bytes': size_bytes,
+                'user_id': user_id,
+            })
+
+        records = db.list_files_with_relations('user-1')
+
+        assert [r['id'] for r in records] == ['conv-1']
+        assert records[0]['media_type'] == 'png'
+        assert records[0]['original_file'] == {
+            'id': 'orig-1',
+            'original_filename': 'photo.jpg',
+            'media_type': 'jpeg',
+            'extension': 'jpg',
+            'size_bytes': 123,
+        }
+        assert not any(key.startswith('rel_') for key in records[0])
+    finally:
+        relations_db.close()
+        db.close()
+
+
+@pytest.mark.parametrize('has_returning', [True, False])
+def test_delete_files_metadata_by_user_returns_storage_paths(monkeypatch, has_returning):
+    monkeypatch.setattr(ConversionDB, 'DB_PATH', ':memory:')
+    monkeypatch.setattr('db.file_db.SQLITE_HAS_RETURNING', has_returning)
+
+    db = ConversionDB()
+    try:
+        db.insert_file_metadata(_conversion_metadata('conv-1', 'user-1'))
+        db.insert_file_metadata(_conversion_metadata('conv-2', 'user-1'))
+        db.insert_file_metadata(_conversion_metadata('conv-3', 'user-2'))
+
+        paths = db.delete_files_metadata_by_user('user-1')
+
+        assert sorted(paths) == ['/tmp/conv-1.png', '/tmp/conv-2.png']
+        assert db.list_files(user_id='user-1') == []
+        assert [f['id'] for f in db.list_files(user_id='user-2')] == ['conv-3']
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize('has_returning', [True, False])
+def test_delete_expired_files_metadata_filters_in_sql(monkeypatch, has_returning):
+    monkeypatch.setattr(ConversionDB, 'DB_PATH', ':memory:')
+    monkeypatch.setattr('db.file_db.SQLITE_HAS_RETURNING', has_returning)
+
+    db = ConversionDB()
+    try:
+        for file_id in ('old', 'fresh', 'no-ts'):
+            db.insert_file_metadata(_conversion_metadata(file_id, 'user-1'))
+        db.conn.executescript(
+            f"UPDATE {db.TABLE_NAME} SET created_at = '2026-01-01 00:00:00' WHERE id = 'old';"
+            f"UPDATE {db.TABLE_NAME} SET created_at = '2026-01-01 02:00:00' WHERE id = 'fresh';"
+            f"UPDATE {db.TABLE_NAME} SET created_at = NULL WHERE id = 'no-ts';"
+        )
+
+        # 2026-01-01 01:00:00 UTC
+        assert db.delete_expired_files_metadata(1767229200) == [('old', '/tmp/old.png')]
+        assert sorted(f['id'] for f in db.list_files()) == ['fresh', 'no-ts']
+    finally:
+        db.close()
+
+
+def test_conversion_relations_db_indexes_lookup_columns(monkeypatch):
+    monkeypatch.setattr(ConversionRelationsDB, 'DB_PATH', ':memory:')
+
+    db = ConversionRelationsDB()
+    try:
+        indexed_columns = set()
+        for index in db.conn.execute(f"PRAGMA index_list({db.TABLE_NAME})").fetchall():
+            for column in db.conn.execute(f"PRAGMA index_info({index[1]})").fetchall():
+                indexed_columns.add(column[2])
+
+        assert {'original_file_id', 'converted_file_id', 'user_id'} <= indexed_columns
+
+        db.insert_conversion_relation({
+            'original_file_id': 'orig',
+            'converted_file_id': 'conv',
+            'original_filename': 'photo.jpg',
+            'original_media_type': 'jpeg',
+            'original_extension': '.jpg',
+            'original_size_bytes': 10,
+            'user_id': 'user-1',
+        })
+        assert db.get_conversion_from_file('orig') == 'conv'
+        assert db.get_original_from_conversion('conv') == 'orig'
+        assert db.get_conversion_from_file('missing') is None
+    finally:
+        db.close()
+
+
+def test_iter_relations_streams_same_rows_as_list_relations(monkeypatch):
+    monkeypatch.setattr(ConversionRelationsDB, 'DB_PATH', ':memory:')
+
+    db = ConversionRelationsDB()
+    try:
+        for index, user_id in enumerate(('user-1', 'user-2', 'user-1')):
+            db.insert_conversion_relation({
+                'original_file_id': f'orig-{index}',
+                'converted_file_id': f'conv-{index}',
+                'original_filename': 'photo.jpg',
+                'original_media_type': 'jpeg',
+                'original_extension': '.jpg',
+                'original_size_bytes': 10,
+                'user_id': user_id,
+            })
+
+        relations = db.iter_relations(user_id='user-1')
+        assert not isinstance(relations, list)
+        assert list(relations) == db.list_relations(user_id='user-1')
+        assert [r['converted_file_id'] for r in db.list_relations(user_id='user-1')] == ['conv-0', 'conv-2']
+    finally:
+        db.close()
@@ -14,9 +14,13 @@ from core.helper_functions import (
     sanitize_filename,
     delete_file_and_metadata,
     compute_sha256_checksum,
+    compute_sha256_checksum_and_size,
     get_file_extension,
     assign_orphaned_rows_to_admin,
     migrate_table_columns,
+    open_sqlite_connection,
+    get_sqlite_connection,
+    release_sqlite_connection,
 )
 
 def test_validate_sql_identifier():
@@ -169,6 +173,12 @@ def test_safe_path_directory_not_allowed(safe_path_test_settings, monkeypatch, t
     file_path = tmp_path / "invalid_directory" / "abcdef123.jpg"
     assert validate_safe_path(file_path, raise_exception=False) == False
 
+def test_safe_path_sibling_directory_with_shared_prefix_not_allowed(safe_path_test_settings, monkeypatch):
+    monkeypatch.setattr('core.helper_functions.get_settings', lambda: safe_path_test_settings)
+    sibling_dir = safe_path_test_settings.upload_dir.with_name("uploads_evil")
+    file_path = sibling_dir / "abcdef123.jpg"
+    assert validate_safe_path(file_path, raise_exception=False) == False
+
 @pytest.mark.parametrize("file", [
     { "raw": "hello.txt", "sanitized": "hello.txt"},
     { "raw": "hello/hello.txt", "sanitized": "hellohello.txt"},
@@ -259,6 +269,20 @@ def test_compute_sha256_checksum_accepts_string_path(tmp_path):
     digest = compute_sha256_checksum(str(f))
     assert isinstance(digest, str) and len(digest) == 64
 
+def test_compute_sha256_checksum_spans_multiple_chunks(tmp_path):
+    import hashlib
+    data = bytes(range(256)) * 41  # not a multiple of the chunk size
+    f = tmp_path / "multi.bin"
+    f.write_bytes(data)
+    assert compute_sha256_checksum(f, chunk_size=1000) == hashlib.sha256(data).hexdigest()
+
+def test_compute_sha256_checksum_and_size(tmp_path):
+    import hashlib
+    data = b"x" * 2500
+    f = tmp_path / "sized.bin"
+    f.write_bytes(data)
+    assert compute_sha256_checksum_and_size(f, chunk_size=1000) == (hashlib.sha256(data).hexdigest(), 2500)
+
 
 # ── get_file_extension ───────────────────────────────────────────────
 
@@ -347,4 +371,53 @@ def test_migrate_table_columns_noop_when_all_present():
     conn.execute("CREATE TABLE t (id TEXT, name TEXT)")
     migrate_table_columns(conn, "t", {"id": "TEXT", "name": "TEXT"})
     cols = {row[1] for row in conn.execute("PRAGMA table_info(t)").fetchall()}
-    assert cols == {"id", "name"}
\ No newline at end of file
+    assert cols == {"id", "name"}
+
+
+# ── open_sqlite_connection ──────────────────────────────────────────
+
+def test_open_sqlite_connection_enables_wal(tmp_path):
+    conn = open_sqlite_connection(tmp_path / "app.db")
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # synchronous=NORMAL is reported as 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+def test_open_sqlite_connection_memory_db_skips_wal():
+    conn = open_sqlite_connection(":memory:")
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_open_sqlite_connection_begins_write_transactions_immediately(tmp_path):
+    conn = open_sqlite_connection(tmp_path / "app.db")
+    try:
+        assert conn.isolation_level == "IMMEDIATE"
+    finally:
+        conn.close()
+
+
+# ── get_sqlite_connection ───────────────────────────────────────────
+
+def test_get_sqlite_connection_shared_within_thread(tmp_path):
+    db_path = tmp_path / "app.db"
+    conn = get_sqlite_connection(db_path)
+    assert get_sqlite_connection(str(db_path)) is conn
+    release_sqlite_connection(db_path, conn)
+    # Shared connections survive release for the thread's other DB handles.
+    assert conn.execute("SELECT 1").fetchone()[0] == 1
+    conn.close()
+
+def test_get_sqlite_connection_memory_db_not_shared():
+    first = get_sqlite_connection(":memory:")
+    second = get_sqlite_connection(":memory:")
+    assert first is not second
+    release_sqlite_connection(":memory:", first)
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+    release_sqlite_connection(":memory:", second)
@@ -27,4 +27,39 @@ def test_update_settings_persists_datetime_display_format(tmp_settings_db):
 
 def test_update_settings_rejects_invalid_datetime_display_format(tmp_settings_db):
     with pytest.raises(ValueError, match="unsupported tokens"):
-        tmp_settings_db.update_settings("user-1", {"datetime_display_format": "DD/MM/YYYY test"})
\ No newline at end of file
+        tmp_settings_db.update_settings("user-1", {"datetime_display_format": "DD/MM/YYYY test"})
+
+
+def test_get_settings_creates_a_single_default_row(tmp_settings_db):
+    tmp_settings_db.get_settings("user-1")
+    tmp_settings_db.update_settings("user-1", {"auto_download": True})
+    tmp_settings_db.get_settings("user-1")
+
+    count = tmp_settings_db.conn.execute(
+        f"SELECT COUNT(*) FROM {tmp_settings_db.TABLE_NAME} WHERE user_id = ?",
+        ("user-1",),
+    ).fetchone()[0]
+    assert count == 1
+
+
+def test_get_settings_cache_is_shared_and_invalidated_on_update(safe_path_test_settings, monkeypatch, tmp_path):
+    monkeypatch.setattr(SettingsDB, "DB_PATH", str(tmp_path / "settings.db"))
+    api_db = SettingsDB()
+    worker_db = SettingsDB()
+    try:
+        assert worker_db.get_settings("user-1")["keep_originals"] is True
+
+        api_db.update_settings("user-1", {"keep_originals": False})
+
+        assert worker_db.get_settings("user-1")["keep_originals"] is False
+    finally:
+        api_db.close()
+        worker_db.close()
+
+
+def test_update_settings_without_known_keys_returns_current_settings(tmp_settings_db):
+    tmp_settings_db.update_settings("user-1", {"auto_download": True})
+
+    settings = tmp_settings_db.update_settings("user-1", {"unknown_key": "x"})
+
+    assert settings["auto_download"] is True
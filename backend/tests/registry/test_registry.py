@@ -50,6 +50,8 @@ def empty_registry():
     reg.converters = {}
     reg.input_format_map = {}
     reg.output_format_map = {}
+    reg._compatible_formats_cache = {}
+    reg._conversion_converter_cache = {}
     return reg
 
 
@@ -181,6 +183,16 @@ def test_converter_for_conversion_none(stub_registry):
     assert stub_registry.get_converter_for_conversion("png", "mp3") is None
 
 
+def test_converter_for_conversion_is_cached(stub_registry, monkeypatch):
+    assert stub_registry.get_converter_for_conversion("png", "jpeg") is _ImageConverter
+
+    def fail(*args):
+        raise AssertionError("lookup should be served from the cache")
+
+    monkeypatch.setattr(stub_registry, "_find_converter_for_conversion", fail)
+    assert stub_registry.get_converter_for_conversion("png", "jpeg") is _ImageConverter
+
+
 # ── list_converters ──────────────────────────────────────────────────
 
 def test_list_converters(stub_registry):
@@ -229,6 +241,23 @@ def test_compatible_formats_unknown_input(stub_registry):
     assert stub_registry.get_compatible_formats_and_qualities("xyz123") == {}
 
 
+def test_compatible_formats_are_cached(stub_registry):
+    first = stub_registry.get_compatible_formats_and_qualities("png")
+    assert stub_registry.get_compatible_formats_and_qualities("png") is first
+
+
+def test_compatible_formats_cache_reset_on_register(stub_registry):
+    class _ExtraPngConverter(ConverterInterface):
+        supported_input_formats = {"png"}
+        supported_output_formats = {"bmp"}
+
+    before = stub_registry.get_compatible_formats_and_qualities("png")
+    stub_registry.register_converter(_ExtraPngConverter)
+    after = stub_registry.get_compatible_formats_and_qualities("png")
+    assert "bmp" not in before
+    assert "bmp" in after
+
+
 # ── get_format_compatibility_matrix ──────────────────────────────────
 
 def test_format_compatibility_matrix_keys(stub_registry):